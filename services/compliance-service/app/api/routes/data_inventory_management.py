@@ -4,9 +4,12 @@ Handles CRUD operations for data inventory entries.
 Implements GDPR Article 30 - Records of Processing Activities.
 """
 
-from typing import Annotated
+import hashlib
+from typing import Annotated, Iterator
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import lambda_stmt
 from sqlmodel import select, Session
 
 from app.api.deps import SessionDep
@@ -31,6 +34,46 @@ router = APIRouter(
 )
 
 
+# Statements built once at import time. Per-request filters and paging are
+# appended as lambdas, so SQLAlchemy caches the SQL compilation per filter
+# combination and only binds new parameter values on each call.
+_LIST_CATEGORIES_STMT = select(DataCategory)
+
+
+def _inventory_list_stmt(
+    category_id: int | None,
+    data_type: str | None,
+    access_level: str | None,
+    skip: int,
+    limit: int,
+):
+    """Build the cached lambda statement for listing inventory entries."""
+    stmt = lambda_stmt(lambda: select(DataInventory))
+    if category_id is not None:
+        stmt += lambda s: s.where(DataInventory.category_id == category_id)
+    if data_type is not None:
+        stmt += lambda s: s.where(DataInventory.data_type == data_type)
+    if access_level is not None:
+        stmt += lambda s: s.where(DataInventory.access_control_level == access_level)
+    stmt += lambda s: s.offset(skip).limit(limit)
+    return stmt
+
+
+def _compute_etag(*parts: object) -> str:
+    """Build a strong ETag from the fields that identify a resource version."""
+    raw = ":".join(str(part) for part in parts).encode()
+    return f'"{hashlib.blake2b(raw, digest_size=12).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header covers the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 # ========== Data Category Management ==========
 
 
@@ -60,14 +103,16 @@ async def create_category(
     Returns:
         Created category with ID
     """
-    logger.info(f"Creating data category: {category.name} by user {current_user.sub}")
+    logger.info(
+        "Creating data category: %s by user %s", category.name, current_user.sub
+    )
 
     # Check for duplicate
     existing = session.exec(
         select(DataCategory).where(DataCategory.name == category.name)
     ).first()
     if existing:
-        logger.warning(f"Category {category.name} already exists")
+        logger.warning("Category %s already exists", category.name)
         raise HTTPException(
             status_code=400, detail="Data category with this name already exists"
         )
@@ -75,8 +120,7 @@ async def create_category(
     db_category = DataCategory.model_validate(category)
     session.add(db_category)
     session.commit()
-    session.refresh(db_category)
-    logger.info(f"Data category created with ID: {db_category.id}")
+    logger.info("Data category created with ID: %s", db_category.id)
     return db_category
 
 
@@ -100,8 +144,8 @@ async def list_categories(
     Returns:
         List of data categories
     """
-    logger.info(f"Listing data categories with skip={skip}, limit={limit}")
-    categories = session.exec(select(DataCategory).offset(skip).limit(limit)).all()
+    logger.info("Listing data categories with skip=%s, limit=%s", skip, limit)
+    categories = session.exec(_LIST_CATEGORIES_STMT.offset(skip).limit(limit)).all()
     return list(categories)
 
 
@@ -113,13 +157,20 @@ async def list_categories(
 async def get_category(
     category_id: int,
     session: SessionDep,
-) -> DataCategory:
+    request: Request,
+    response: Response,
+) -> DataCategory | Response:
     """
     Get details of a specific data category.
 
+    Supports conditional requests: the response carries an ETag and a
+    matching If-None-Match header yields 304 Not Modified with no body.
+
     Args:
         category_id: Category ID
         session: Database session
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
 
     Returns:
         Category details
@@ -127,11 +178,16 @@ async def get_category(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Fetching category: {category_id}")
+    logger.info("Fetching category: %s", category_id)
     category = session.get(DataCategory, category_id)
     if not category:
-        logger.warning(f"Category {category_id} not found")
+        logger.warning("Category %s not found", category_id)
         raise HTTPException(status_code=404, detail="Data category not found")
+
+    etag = _compute_etag(category.id, category.updated_at)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return category
 
 
@@ -165,10 +221,10 @@ async def update_category(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Updating category {category_id} by user {current_user.sub}")
+    logger.info("Updating category %s by user %s", category_id, current_user.sub)
     db_category = session.get(DataCategory, category_id)
     if not db_category:
-        logger.warning(f"Category {category_id} not found for update")
+        logger.warning("Category %s not found for update", category_id)
         raise HTTPException(status_code=404, detail="Data category not found")
 
     update_data = category_update.model_dump(exclude_unset=True)
@@ -176,8 +232,7 @@ async def update_category(
     db_category.updated_at = datetime.utcnow()
     session.add(db_category)
     session.commit()
-    session.refresh(db_category)
-    logger.info(f"Category {category_id} updated successfully")
+    logger.info("Category %s updated successfully", category_id)
     return db_category
 
 
@@ -206,28 +261,31 @@ async def delete_category(
     Raises:
         HTTPException: 404 if not found, 400 if category has inventory items
     """
-    logger.info(f"Deleting category {category_id} by user {current_user.sub}")
-    db_category = session.get(DataCategory, category_id)
-    if not db_category:
-        logger.warning(f"Category {category_id} not found for deletion")
-        raise HTTPException(status_code=404, detail="Data category not found")
-
-    # Check if category has inventory items
-    inventory_count = session.exec(
-        select(DataInventory).where(DataInventory.category_id == category_id)
-    ).all()
-    if inventory_count:
-        logger.warning(
-            f"Cannot delete category {category_id}: has {len(inventory_count)} inventory items"
-        )
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot delete category with existing inventory entries",
-        )
+    logger.info("Deleting category %s by user %s", category_id, current_user.sub)
+    # Both lookups and the delete run in one transaction, committed on exit
+    with session.begin():
+        db_category = session.get(DataCategory, category_id)
+        if not db_category:
+            logger.warning("Category %s not found for deletion", category_id)
+            raise HTTPException(status_code=404, detail="Data category not found")
 
-    session.delete(db_category)
-    session.commit()
-    logger.info(f"Category {category_id} deleted successfully")
+        # Check if category has inventory items
+        inventory_count = session.exec(
+            select(DataInventory).where(DataInventory.category_id == category_id)
+        ).all()
+        if inventory_count:
+            logger.warning(
+                "Cannot delete category %s: has %s inventory items",
+                category_id,
+                len(inventory_count),
+            )
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot delete category with existing inventory entries",
+            )
+
+        session.delete(db_category)
+    logger.info("Category %s deleted successfully", category_id)
     return {"ok": True, "message": "Data category deleted"}
 
 
@@ -261,20 +319,21 @@ async def create_inventory_entry(
         Created inventory entry with ID
     """
     logger.info(
-        f"Creating data inventory entry: {inventory.data_name} by user {current_user.sub}"
+        "Creating data inventory entry: %s by user %s",
+        inventory.data_name,
+        current_user.sub,
     )
 
     # Verify category exists
     category = session.get(DataCategory, inventory.category_id)
     if not category:
-        logger.warning(f"Category {inventory.category_id} not found")
+        logger.warning("Category %s not found", inventory.category_id)
         raise HTTPException(status_code=404, detail="Data category not found")
 
     db_inventory = DataInventory.model_validate(inventory)
     session.add(db_inventory)
     session.commit()
-    session.refresh(db_inventory)
-    logger.info(f"Data inventory entry created with ID: {db_inventory.id}")
+    logger.info("Data inventory entry created with ID: %s", db_inventory.id)
     return db_inventory
 
 
@@ -290,7 +349,8 @@ async def list_inventory_entries(
     access_level: str | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: Annotated[int, Query(le=100)] = 100,
-) -> list[DataInventory]:
+    stream: bool = Query(False),
+) -> list[DataInventory] | StreamingResponse:
     """
     List all data inventory entries with optional filtering.
 
@@ -300,26 +360,37 @@ async def list_inventory_entries(
     - access_level: Filter by access control level
     - skip: Number of records to skip (default: 0)
     - limit: Maximum records to return (default: 100, max: 100)
+    - stream: Stream entries as NDJSON (one JSON object per line) instead of
+      returning a single JSON array (default: false)
 
     Returns:
-        List of inventory entries
+        List of inventory entries, or an NDJSON stream when stream=true
     """
     logger.info(
-        f"Listing inventory entries with skip={skip}, limit={limit}, "
-        f"category={category_id}, type={data_type}, access_level={access_level}"
+        "Listing inventory entries with skip=%s, limit=%s, "
+        "category=%s, type=%s, access_level=%s",
+        skip,
+        limit,
+        category_id,
+        data_type,
+        access_level,
     )
 
-    query = select(DataInventory)
+    query = _inventory_list_stmt(category_id, data_type, access_level, skip, limit)
 
-    if category_id is not None:
-        query = query.where(DataInventory.category_id == category_id)
-    if data_type is not None:
-        query = query.where(DataInventory.data_type == data_type)
-    if access_level is not None:
-        query = query.where(DataInventory.access_control_level == access_level)
+    if stream:
+
+        def generate_entries() -> Iterator[str]:
+            # Rows are fetched in chunks and serialized one at a time, so the
+            # full page is never held in memory.
+            rows = session.exec(query.execution_options(yield_per=50)).scalars()
+            for entry in rows:
+                yield DataInventoryPublic.model_validate(entry).model_dump_json() + "\n"
+
+        return StreamingResponse(generate_entries(), media_type="application/x-ndjson")
 
-    entries = session.exec(query.offset(skip).limit(limit)).all()
-    logger.info(f"Retrieved {len(entries)} inventory entries")
+    entries = session.exec(query).scalars().all()
+    logger.info("Retrieved %s inventory entries", len(entries))
     return list(entries)
 
 
@@ -331,13 +402,19 @@ async def list_inventory_entries(
 async def get_inventory_entry(
     inventory_id: int,
     session: SessionDep,
-) -> DataInventory:
+    request: Request,
+    response: Response,
+) -> DataInventory | Response:
     """
     Get details of a specific inventory entry.
 
+    Supports conditional requests via ETag / If-None-Match (304 on match).
+
     Args:
         inventory_id: Inventory entry ID
         session: Database session
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
 
     Returns:
         Inventory entry details
@@ -345,11 +422,16 @@ async def get_inventory_entry(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Fetching inventory entry: {inventory_id}")
+    logger.info("Fetching inventory entry: %s", inventory_id)
     entry = session.get(DataInventory, inventory_id)
     if not entry:
-        logger.warning(f"Inventory entry {inventory_id} not found")
+        logger.warning("Inventory entry %s not found", inventory_id)
         raise HTTPException(status_code=404, detail="Data inventory entry not found")
+
+    etag = _compute_etag(entry.id, entry.updated_at)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return entry
 
 
@@ -383,26 +465,29 @@ async def update_inventory_entry(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Updating inventory entry {inventory_id} by user {current_user.sub}")
-    db_entry = session.get(DataInventory, inventory_id)
-    if not db_entry:
-        logger.warning(f"Inventory entry {inventory_id} not found for update")
-        raise HTTPException(status_code=404, detail="Data inventory entry not found")
-
-    # Verify category if being updated
-    if inventory_update.category_id is not None:
-        category = session.get(DataCategory, inventory_update.category_id)
-        if not category:
-            logger.warning(f"Category {inventory_update.category_id} not found")
-            raise HTTPException(status_code=404, detail="Data category not found")
-
-    update_data = inventory_update.model_dump(exclude_unset=True)
-    db_entry = db_entry.sqlmodel_update(update_data)
-    db_entry.updated_at = datetime.utcnow()
-    session.add(db_entry)
-    session.commit()
-    session.refresh(db_entry)
-    logger.info(f"Inventory entry {inventory_id} updated successfully")
+    logger.info(
+        "Updating inventory entry %s by user %s", inventory_id, current_user.sub
+    )
+    with session.begin():
+        db_entry = session.get(DataInventory, inventory_id)
+        if not db_entry:
+            logger.warning("Inventory entry %s not found for update", inventory_id)
+            raise HTTPException(
+                status_code=404, detail="Data inventory entry not found"
+            )
+
+        # Verify category if being updated; commit happens once on exit
+        if inventory_update.category_id is not None:
+            category = session.get(DataCategory, inventory_update.category_id)
+            if not category:
+                logger.warning("Category %s not found", inventory_update.category_id)
+                raise HTTPException(status_code=404, detail="Data category not found")
+
+        update_data = inventory_update.model_dump(exclude_unset=True)
+        db_entry = db_entry.sqlmodel_update(update_data)
+        db_entry.updated_at = datetime.utcnow()
+        session.add(db_entry)
+    logger.info("Inventory entry %s updated successfully", inventory_id)
     return db_entry
 
 
@@ -431,32 +516,42 @@ async def delete_inventory_entry(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Deleting inventory entry {inventory_id} by user {current_user.sub}")
+    logger.info(
+        "Deleting inventory entry %s by user %s", inventory_id, current_user.sub
+    )
     db_entry = session.get(DataInventory, inventory_id)
     if not db_entry:
-        logger.warning(f"Inventory entry {inventory_id} not found for deletion")
+        logger.warning("Inventory entry %s not found for deletion", inventory_id)
         raise HTTPException(status_code=404, detail="Data inventory entry not found")
 
     session.delete(db_entry)
     session.commit()
-    logger.info(f"Inventory entry {inventory_id} deleted successfully")
+    logger.info("Inventory entry %s deleted successfully", inventory_id)
     return {"ok": True, "message": "Data inventory entry deleted"}
 
 
 @router.get(
     "/entries/{inventory_id}/stats",
+    response_model=None,
     summary="Get inventory entry statistics",
 )
 async def get_inventory_stats(
     inventory_id: int,
     session: SessionDep,
-) -> dict:
+    request: Request,
+    response: Response,
+) -> dict | Response:
     """
     Get statistics and metadata for an inventory entry.
 
+    Supports conditional requests via ETag / If-None-Match (304 on match).
+    The ETag covers both the entry and its category.
+
     Args:
         inventory_id: Inventory entry ID
         session: Database session
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
 
     Returns:
         Statistics and metadata
@@ -464,15 +559,25 @@ async def get_inventory_stats(
     Raises:
         HTTPException: 404 if not found
     """
-    logger.info(f"Getting stats for inventory entry: {inventory_id}")
+    logger.info("Getting stats for inventory entry: %s", inventory_id)
     entry = session.get(DataInventory, inventory_id)
     if not entry:
-        logger.warning(f"Inventory entry {inventory_id} not found")
+        logger.warning("Inventory entry %s not found", inventory_id)
         raise HTTPException(status_code=404, detail="Data inventory entry not found")
 
     # Get category info
     category = session.get(DataCategory, entry.category_id)
 
+    etag = _compute_etag(
+        entry.id,
+        entry.updated_at,
+        category.id if category else None,
+        category.updated_at if category else None,
+    )
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     return {
         "inventory_id": inventory_id,
         "data_name": entry.data_name,
@@ -47,6 +47,8 @@ class Settings(BaseSettings):
     JWT_ISSUER: str | None = (
         None  # Set to None to skip issuer validation, or set to expected issuer
     )
+    TOKEN_CACHE_TTL_SECONDS: int = 60  # Max time a decoded token is reused
+    TOKEN_CACHE_MAX_SIZE: int = 4096
 
     # Security Settings (for future use)
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
@@ -59,6 +61,10 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_CLIENT_ID: str = "compliance-service"
     KAFKA_COMPLIANCE_TOPIC: str = "compliance-queue"
+    KAFKA_BATCH_SIZE: int = 64  # Max compliance events per producer batch
+    KAFKA_BATCH_LINGER_MS: int = 5  # Max wait for a batch to fill
+    KAFKA_MAX_IN_FLIGHT: int = 1024  # Max unacknowledged compliance events
+    KAFKA_SHUTDOWN_TIMEOUT_SECONDS: float = 10  # Max wait to flush on shutdown
 
     # External Service URLs
     EMPLOYEE_SERVICE_URL: str = "http://localhost:8001"
@@ -56,8 +56,12 @@ def get_session() -> Generator[Session, None, None]:
     Dependency that provides a database session.
     Automatically handles session lifecycle and cleanup.
 
+    Objects are not expired on commit: all column defaults are generated
+    client-side and the primary key is populated on flush, so handlers can
+    return freshly written rows without a follow-up SELECT.
+
     Yields:
         Session: SQLModel database session
     """
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
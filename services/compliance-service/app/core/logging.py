@@ -3,8 +3,20 @@ Centralized logging configuration module.
 Provides consistent logging setup across the application.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Records are handed to a background listener thread so request handlers only
+# pay for a queue.put; the listener owns the real stdout handler.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter("      %(levelname)-5s  %(message)s"))
+_listener = QueueListener(_log_queue, _stream_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -22,9 +34,7 @@ def setup_logger(name: str) -> logging.Logger:
 
     # Add handler only if not already present to avoid duplicates
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter("      %(levelname)-5s  %(message)s"))
-        logger.addHandler(handler)
+        logger.addHandler(QueueHandler(_log_queue))
         logger.propagate = False  # Don't propagate to root logger to avoid duplicates
 
     return logger
@@ -3,7 +3,11 @@ Security module for JWT authentication using JWKS endpoint.
 Implements token validation, role/permission extraction for Asgardeo.
 """
 
+import hashlib
 import json
+import threading
+import time
+from functools import lru_cache
 from typing import Annotated, Any
 from datetime import datetime, timedelta
 import jwt
@@ -47,6 +51,55 @@ class TokenData(BaseModel):
     raw_claims: dict[str, Any] = {}  # All other claims
 
 
+# Cache of successfully decoded tokens: token digest -> (expires_at, TokenData).
+# Lets repeated calls with the same bearer token skip RS256 verification.
+_token_cache: dict[bytes, tuple[float, TokenData]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash the raw token so the cache never holds bearer credentials."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_token(key: bytes) -> TokenData | None:
+    """Return cached TokenData for the key if it has not expired yet."""
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, token_data = entry
+    if expires_at <= time.time():
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+    return token_data
+
+
+def _cache_token(key: bytes, token_data: TokenData) -> None:
+    """
+    Cache decoded TokenData until the earlier of the cache TTL and token expiry.
+
+    When the cache is full, expired entries are purged first and the oldest
+    entry is evicted if that does not free a slot.
+    """
+    now = time.time()
+    ttl = float(settings.TOKEN_CACHE_TTL_SECONDS)
+    if token_data.exp is not None:
+        ttl = min(ttl, token_data.exp - now)
+    if ttl <= 0:
+        return
+
+    with _token_cache_lock:
+        if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+            expired = [k for k, (exp, _) in _token_cache.items() if exp <= now]
+            for k in expired:
+                del _token_cache[k]
+            if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+                _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (now + ttl, token_data)
+
+
 def decode_token(token: str) -> TokenData:
     """
     Decode and validate JWT token using JWKS endpoint.
@@ -60,6 +113,11 @@ def decode_token(token: str) -> TokenData:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    cache_key = _token_cache_key(token)
+    cached = _get_cached_token(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Get the signing key from JWKS
         signing_key = jwks_client.get_signing_key_from_jwt(token)
@@ -173,6 +231,7 @@ def decode_token(token: str) -> TokenData:
             raw_claims=payload,
         )
 
+        _cache_token(cache_key, token_data)
         return token_data
 
     except jwt.ExpiredSignatureError:
@@ -240,6 +299,7 @@ async def get_current_active_user(
     return current_user
 
 
+@lru_cache(maxsize=32)
 def require_role(*required_roles: str):
     """
     Dependency factory to require specific roles.
@@ -253,6 +313,9 @@ def require_role(*required_roles: str):
             # Only users with admin OR superuser role can access
             pass
 
+    The factory is memoized, so every route guarded by the same roles shares
+    one dependency callable and FastAPI resolves it once per request.
+
     Args:
         *required_roles: One or more required roles (user needs at least one)
 
@@ -281,6 +344,7 @@ def require_role(*required_roles: str):
     return check_roles
 
 
+@lru_cache(maxsize=32)
 def require_permission(*required_permissions: str):
     """
     Dependency factory to require specific permissions.
@@ -322,6 +386,7 @@ def require_permission(*required_permissions: str):
     return check_permissions
 
 
+@lru_cache(maxsize=32)
 def require_all_roles(*required_roles: str):
     """
     Dependency factory to require ALL specified roles.
@@ -4,9 +4,11 @@ Compliance Service - GDPR compliance management and data inventory tracking.
 Main application file with modular configuration.
 """
 
+import json
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config import settings
 from app.core.database import create_db_and_tables
@@ -14,6 +16,7 @@ from app.core.logging import get_logger
 from app.api.routes.compliance import router as compliance_router
 from app.api.routes.data_inventory_management import router as inventory_router
 from app.api.routes.auth import router as auth_router
+from app.services.compliance_events import flush_compliance_events
 
 logger = get_logger(__name__)
 
@@ -35,6 +38,7 @@ async def lifespan(_: FastAPI):
 
     # Shutdown
     logger.info("Compliance Service shutting down...")
+    await flush_compliance_events()
 
 
 # Initialize FastAPI application
@@ -57,6 +61,10 @@ app.add_middleware(
     allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
+# Compress larger JSON payloads (inventory listings, stats); small responses
+# such as health checks are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
@@ -65,26 +73,18 @@ app.include_router(inventory_router, prefix="/api/v1")
 
 
 # Health check endpoints
-@app.get("/", tags=["health"])
-async def health_check():
-    """
-    Health check endpoint.
-    Returns service status and basic information.
-    """
-    return {
+# Their payloads only depend on settings, so they are serialized once at import
+# and served as raw bytes (no per-request dict building or JSON encoding).
+_HEALTH_BYTES = json.dumps(
+    {
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
+).encode()
 
-
-@app.get("/health", tags=["health"])
-async def detailed_health_check():
-    """
-    Detailed health check endpoint.
-    Returns service status and database information.
-    """
-    return {
+_DETAILED_HEALTH_BYTES = json.dumps(
+    {
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
@@ -95,14 +95,10 @@ async def detailed_health_check():
             "auth": "/api/v1/auth",
         },
     }
+).encode()
 
-
-@app.get("/docs/endpoints", tags=["documentation"])
-async def api_endpoints_info():
-    """
-    Get information about available API endpoints.
-    """
-    return {
+_ENDPOINTS_INFO_BYTES = json.dumps(
+    {
         "service": "Compliance Service",
         "version": settings.APP_VERSION,
         "endpoints": {
@@ -125,3 +121,30 @@ async def api_endpoints_info():
             },
         },
     }
+).encode()
+
+
+@app.get("/", tags=["health"])
+async def health_check() -> Response:
+    """
+    Health check endpoint.
+    Returns service status and basic information.
+    """
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+@app.get("/health", tags=["health"])
+async def detailed_health_check() -> Response:
+    """
+    Detailed health check endpoint.
+    Returns service status and database information.
+    """
+    return Response(content=_DETAILED_HEALTH_BYTES, media_type="application/json")
+
+
+@app.get("/docs/endpoints", tags=["documentation"])
+async def api_endpoints_info() -> Response:
+    """
+    Get information about available API endpoints.
+    """
+    return Response(content=_ENDPOINTS_INFO_BYTES, media_type="application/json")
@@ -3,23 +3,27 @@ Employee Data Access and Data Retention Pydantic schemas.
 Defines request/response models for access control and retention tracking endpoints.
 """
 
-from sqlmodel import SQLModel, Field
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
+from app.schemas.fields import NonEmptyStr255, Str50, Str100, Str255, Str500
 
-class EmployeeDataAccessBase(SQLModel):
+
+class EmployeeDataAccessBase(BaseModel):
     """Base schema for employee data access with shared fields."""
 
-    employee_id: str = Field(max_length=255, min_length=1)
+    model_config = ConfigDict(from_attributes=True)
+
+    employee_id: NonEmptyStr255
     data_inventory_id: int
-    access_level: str = Field(max_length=50)  # read, write, delete, admin
-    access_reason: str = Field(max_length=500)
-    role_based: bool = Field(default=True)
-    role_name: Optional[str] = Field(default=None, max_length=100)
-    granted_by: Optional[str] = Field(default=None, max_length=255)
+    access_level: Str50  # read, write, delete, admin
+    access_reason: Str500
+    role_based: bool = True
+    role_name: Optional[Str100] = None
+    granted_by: Optional[Str255] = None
     expires_at: Optional[datetime] = None
-    is_active: bool = Field(default=True)
+    is_active: bool = True
 
 
 class EmployeeDataAccessCreate(EmployeeDataAccessBase):
@@ -28,11 +32,13 @@ class EmployeeDataAccessCreate(EmployeeDataAccessBase):
     pass
 
 
-class EmployeeDataAccessUpdate(SQLModel):
+class EmployeeDataAccessUpdate(BaseModel):
     """Schema for updating employee data access - all fields optional."""
 
-    access_level: Optional[str] = Field(default=None, max_length=50)
-    access_reason: Optional[str] = Field(default=None, max_length=500)
+    model_config = ConfigDict(from_attributes=True)
+
+    access_level: Optional[Str50] = None
+    access_reason: Optional[Str500] = None
     expires_at: Optional[datetime] = None
     is_active: Optional[bool] = None
 
@@ -46,34 +52,40 @@ class EmployeeDataAccessPublic(EmployeeDataAccessBase):
     updated_at: datetime
 
 
-class DataRetentionBase(SQLModel):
+class DataRetentionBase(BaseModel):
     """Base schema for data retention tracking with shared fields."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     data_inventory_id: int
-    record_id: str = Field(max_length=255)
+    record_id: Str255
     data_created_at: datetime
     retention_expires_at: datetime
-    retention_status: str = Field(default="active", max_length=50)
-    marked_for_deletion: bool = Field(default=False)
-    deletion_reason: Optional[str] = Field(default=None, max_length=500)
-    data_subject_id: Optional[str] = Field(default=None, max_length=255)
+    retention_status: Str50 = "active"
+    marked_for_deletion: bool = False
+    deletion_reason: Optional[Str500] = None
+    data_subject_id: Optional[Str255] = None
 
 
-class DataRetentionCreate(SQLModel):
+class DataRetentionCreate(BaseModel):
     """Schema for creating data retention records."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     data_inventory_id: int
-    record_id: str = Field(max_length=255)
+    record_id: Str255
     data_created_at: datetime
-    data_subject_id: Optional[str] = Field(default=None, max_length=255)
+    data_subject_id: Optional[Str255] = None
 
 
-class DataRetentionUpdate(SQLModel):
+class DataRetentionUpdate(BaseModel):
     """Schema for updating data retention records."""
 
-    retention_status: Optional[str] = Field(default=None, max_length=50)
+    model_config = ConfigDict(from_attributes=True)
+
+    retention_status: Optional[Str50] = None
     marked_for_deletion: Optional[bool] = None
-    deletion_reason: Optional[str] = Field(default=None, max_length=500)
+    deletion_reason: Optional[Str500] = None
 
 
 class DataRetentionPublic(DataRetentionBase):
@@ -87,9 +99,11 @@ class DataRetentionPublic(DataRetentionBase):
     updated_at: datetime
 
 
-class EmployeeDataAboutMe(SQLModel):
+class EmployeeDataAboutMe(BaseModel):
     """Schema for employee's personal data summary (GDPR Article 15 - Right of Access)."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     employee_id: str
     data_categories: list[str]
     total_records: int
@@ -98,9 +112,11 @@ class EmployeeDataAboutMe(SQLModel):
     access_granted_at: datetime
 
 
-class EmployeeAccessControls(SQLModel):
+class EmployeeAccessControls(BaseModel):
     """Schema showing what data an employee can access and why."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     employee_id: str
     accessible_data_categories: list[dict]  # {id, name, access_level, reason}
     total_access_entries: int
@@ -108,9 +124,11 @@ class EmployeeAccessControls(SQLModel):
     direct_accesses: int
 
 
-class DataRetentionReport(SQLModel):
+class DataRetentionReport(BaseModel):
     """Schema for data retention report showing what needs deletion."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     total_records_tracked: int
     active_records: int
     expiring_soon: int  # Within 30 days
@@ -4,19 +4,29 @@ Defines request/response models for Data Inventory API endpoints.
 Implements GDPR Article 30 - Records of Processing Activities.
 """
 
-from sqlmodel import SQLModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional
 
+from app.schemas.fields import (
+    NonEmptyStr255,
+    Str50,
+    Str100,
+    Str255,
+    Str500,
+    Str1000,
+    Str2000,
+)
 
-class DataCategoryBase(SQLModel):
+
+class DataCategoryBase(BaseModel):
     """Base schema for data categories with shared fields."""
 
-    name: str = Field(max_length=255, min_length=1)
-    description: Optional[str] = Field(default=None, max_length=1000)
-    sensitivity_level: str = Field(
-        default="low", max_length=50
-    )  # low, medium, high, critical
+    model_config = ConfigDict(from_attributes=True)
+
+    name: NonEmptyStr255
+    description: Optional[Str1000] = None
+    sensitivity_level: Str50 = "low"  # low, medium, high, critical
 
 
 class DataCategoryCreate(DataCategoryBase):
@@ -33,25 +43,27 @@ class DataCategoryPublic(DataCategoryBase):
     updated_at: datetime
 
 
-class DataInventoryBase(SQLModel):
+class DataInventoryBase(BaseModel):
     """Base schema for data inventory with shared fields."""
 
-    data_name: str = Field(max_length=255, min_length=1)
-    description: Optional[str] = Field(default=None, max_length=2000)
+    model_config = ConfigDict(from_attributes=True)
+
+    data_name: NonEmptyStr255
+    description: Optional[Str2000] = None
     category_id: int
-    data_type: str = Field(max_length=100)  # personal, sensitive, employment, etc.
-    storage_location: str = Field(max_length=255)
-    purpose_of_processing: str = Field(max_length=1000)
-    legal_basis: str = Field(max_length=500)
+    data_type: Str100  # personal, sensitive, employment, etc.
+    storage_location: Str255
+    purpose_of_processing: Str1000
+    legal_basis: Str500
     retention_days: int = Field(default=365, ge=1)
-    retention_policy: Optional[str] = Field(default=None, max_length=1000)
-    data_subjects: str = Field(max_length=500)
-    recipients: Optional[str] = Field(default=None, max_length=1000)
-    third_party_sharing: bool = Field(default=False)
-    third_party_recipients: Optional[str] = Field(default=None, max_length=1000)
-    encryption_status: str = Field(default="encrypted", max_length=50)
-    access_control_level: str = Field(default="restricted", max_length=50)
-    processing_system: str = Field(max_length=255)
+    retention_policy: Optional[Str1000] = None
+    data_subjects: Str500
+    recipients: Optional[Str1000] = None
+    third_party_sharing: bool = False
+    third_party_recipients: Optional[Str1000] = None
+    encryption_status: Str50 = "encrypted"
+    access_control_level: Str50 = "restricted"
+    processing_system: Str255
 
 
 class DataInventoryCreate(DataInventoryBase):
@@ -60,25 +72,27 @@ class DataInventoryCreate(DataInventoryBase):
     pass
 
 
-class DataInventoryUpdate(SQLModel):
+class DataInventoryUpdate(BaseModel):
     """Schema for updating data inventory entries - all fields optional."""
 
-    data_name: Optional[str] = Field(default=None, max_length=255)
-    description: Optional[str] = Field(default=None, max_length=2000)
+    model_config = ConfigDict(from_attributes=True)
+
+    data_name: Optional[Str255] = None
+    description: Optional[Str2000] = None
     category_id: Optional[int] = None
-    data_type: Optional[str] = Field(default=None, max_length=100)
-    storage_location: Optional[str] = Field(default=None, max_length=255)
-    purpose_of_processing: Optional[str] = Field(default=None, max_length=1000)
-    legal_basis: Optional[str] = Field(default=None, max_length=500)
+    data_type: Optional[Str100] = None
+    storage_location: Optional[Str255] = None
+    purpose_of_processing: Optional[Str1000] = None
+    legal_basis: Optional[Str500] = None
     retention_days: Optional[int] = Field(default=None, ge=1)
-    retention_policy: Optional[str] = Field(default=None, max_length=1000)
-    data_subjects: Optional[str] = Field(default=None, max_length=500)
-    recipients: Optional[str] = Field(default=None, max_length=1000)
+    retention_policy: Optional[Str1000] = None
+    data_subjects: Optional[Str500] = None
+    recipients: Optional[Str1000] = None
     third_party_sharing: Optional[bool] = None
-    third_party_recipients: Optional[str] = Field(default=None, max_length=1000)
-    encryption_status: Optional[str] = Field(default=None, max_length=50)
-    access_control_level: Optional[str] = Field(default=None, max_length=50)
-    processing_system: Optional[str] = Field(default=None, max_length=255)
+    third_party_recipients: Optional[Str1000] = None
+    encryption_status: Optional[Str50] = None
+    access_control_level: Optional[Str50] = None
+    processing_system: Optional[Str255] = None
 
 
 class DataInventoryPublic(DataInventoryBase):
@@ -90,14 +104,16 @@ class DataInventoryPublic(DataInventoryBase):
     last_retention_check: Optional[datetime] = None
 
 
-class DataInventorySummary(SQLModel):
+class DataInventorySummary(BaseModel):
     """Simplified schema for data inventory summary."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     data_name: str
     data_type: str
     category_id: int
     retention_days: int
-    is_sensitive: bool = Field(default=False)
+    is_sensitive: bool = False
     access_control_level: str
     encryption_status: str
@@ -0,0 +1,16 @@
+"""
+Shared constrained field types for the compliance schemas.
+Each alias carries a single FieldInfo that every schema field using it shares.
+"""
+
+from typing import Annotated
+
+from pydantic import Field
+
+Str50 = Annotated[str, Field(max_length=50)]
+Str100 = Annotated[str, Field(max_length=100)]
+Str255 = Annotated[str, Field(max_length=255)]
+Str500 = Annotated[str, Field(max_length=500)]
+Str1000 = Annotated[str, Field(max_length=1000)]
+Str2000 = Annotated[str, Field(max_length=2000)]
+NonEmptyStr255 = Annotated[str, Field(max_length=255, min_length=1)]
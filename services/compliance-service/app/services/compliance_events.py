@@ -1,15 +1,199 @@
 """
 Compliance event publishing utilities.
 Handles async Kafka event publishing for compliance-related events such as violations, alerts, and check completions.
+
+Events are buffered in an in-process queue and sent to Kafka in batches by a
+background task, so callers never wait on a broker round-trip.
 """
 
+import asyncio
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from app.core.logging import get_logger
 from app.core.config import settings
 
 logger = get_logger(__name__)
 
+_UTC = timezone.utc
+
+try:
+    from shared.kafka import (
+        EventType,
+        KafkaProducer,
+        create_compliance_event,
+        get_producer,
+    )
+
+    _KAFKA_AVAILABLE = True
+    # Map string to EventType enum – extend as needed
+    _EVENT_TYPE_MAP = {
+        "violation": EventType.COMPLIANCE_VIOLATION,
+        "alert": EventType.COMPLIANCE_ALERT,
+        "check_completed": EventType.COMPLIANCE_CHECK_COMPLETED,
+    }
+except ImportError as e:
+    logger.warning("Kafka support unavailable, compliance events disabled: %s", e)
+    _KAFKA_AVAILABLE = False
+    _EVENT_TYPE_MAP = {}
+
+_producer: Optional["KafkaProducer"] = None
+_producer_lock = asyncio.Lock()
+
+# Sentinel pushed onto the queue to tell the flush task to stop
+_STOP = object()
+
+_event_queue: asyncio.Queue = asyncio.Queue()
+_flush_task: Optional[asyncio.Task] = None
+
+# Bounds unacknowledged sends so a slow broker applies backpressure
+_in_flight = asyncio.Semaphore(settings.KAFKA_MAX_IN_FLIGHT)
+
+
+def _log_send_result(future: asyncio.Future) -> None:
+    """Release the in-flight slot for a sent event and log its delivery result."""
+    _in_flight.release()
+    if future.cancelled():
+        logger.warning("Compliance event send was cancelled")
+    elif future.exception() is not None:
+        logger.error(
+            "Failed to send compliance event via Kafka: %s", future.exception()
+        )
+    else:
+        metadata = future.result()
+        logger.debug(
+            "Compliance event acknowledged: partition=%s, offset=%s",
+            metadata.partition,
+            metadata.offset,
+        )
+
+
+async def _get_producer() -> "KafkaProducer":
+    """Return the cached Kafka producer, creating it on first use."""
+    global _producer
+
+    if _producer is None:
+        async with _producer_lock:
+            if _producer is None:
+                _producer = await get_producer(
+                    bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
+                    client_id=settings.KAFKA_CLIENT_ID,
+                )
+    return _producer
+
+
+async def _send_batch(batch: list) -> None:
+    """Hand a batch of compliance events to the Kafka producer.
+
+    Sends are not awaited: each delivery future gets a callback that logs the
+    result, and the in-flight semaphore caps how many can be unacknowledged.
+    """
+    try:
+        producer = await _get_producer()
+        if not producer or not producer.is_started:
+            logger.warning(
+                "Kafka producer not started, dropping %s compliance events", len(batch)
+            )
+            return
+
+        for event in batch:
+            await _in_flight.acquire()
+            try:
+                future = await producer.send_event_nowait(
+                    settings.KAFKA_COMPLIANCE_TOPIC, event
+                )
+            except Exception:
+                _in_flight.release()
+                raise
+            future.add_done_callback(_log_send_result)
+    except Exception as e:
+        logger.error("Error publishing compliance events: %s", e)
+
+
+async def _flush_events() -> None:
+    """Drain the event queue, sending up to KAFKA_BATCH_SIZE events at a time.
+
+    A batch is sent once it is full or KAFKA_BATCH_LINGER_MS has passed since
+    its first event arrived, whichever comes first.
+    """
+    loop = asyncio.get_running_loop()
+    linger = settings.KAFKA_BATCH_LINGER_MS / 1000
+    stopping = False
+
+    while not stopping:
+        event = await _event_queue.get()
+        if event is _STOP:
+            return
+
+        batch = [event]
+        deadline = loop.time() + linger
+        while len(batch) < settings.KAFKA_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(_event_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if event is _STOP:
+                stopping = True
+                break
+            batch.append(event)
+
+        await _send_batch(batch)
+
+
+async def flush_compliance_events() -> None:
+    """Send any buffered compliance events and stop the flush task.
+
+    Waits until every sent event has been acknowledged, for at most
+    KAFKA_SHUTDOWN_TIMEOUT_SECONDS in total, so an unreachable broker cannot
+    hold up shutdown. Events still queued or unacknowledged at the deadline
+    are logged and given up on. Called from the application shutdown hook.
+    """
+    global _flush_task
+
+    if _flush_task is None or _flush_task.done():
+        return
+
+    flushed = False
+    reclaimed = 0
+
+    async def drain() -> None:
+        nonlocal flushed, reclaimed
+        await _flush_task
+        flushed = True
+        # Reclaim every in-flight slot, i.e. wait for outstanding acknowledgments
+        while reclaimed < settings.KAFKA_MAX_IN_FLIGHT:
+            await _in_flight.acquire()
+            reclaimed += 1
+
+    _event_queue.put_nowait(_STOP)
+    try:
+        await asyncio.wait_for(drain(), settings.KAFKA_SHUTDOWN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        if flushed:
+            logger.warning(
+                "Gave up on %s unacknowledged compliance events after %ss",
+                settings.KAFKA_MAX_IN_FLIGHT - reclaimed,
+                settings.KAFKA_SHUTDOWN_TIMEOUT_SECONDS,
+            )
+        else:
+            dropped = 0
+            while not _event_queue.empty():
+                if _event_queue.get_nowait() is not _STOP:
+                    dropped += 1
+            logger.warning(
+                "Timed out flushing compliance events after %ss, "
+                "dropped %s still queued",
+                settings.KAFKA_SHUTDOWN_TIMEOUT_SECONDS,
+                dropped,
+            )
+    _flush_task = None
+
+    for _ in range(reclaimed):
+        _in_flight.release()
+
+
 async def publish_compliance_event(
     event_type_str: str,
     compliance_id: int,
@@ -17,43 +201,33 @@ async def publish_compliance_event(
     description: Optional[str] = None,
     timestamp: Optional[datetime] = None,
 ) -> bool:
-    """Publish a compliance event to Kafka.
+    """Queue a compliance event for publishing to Kafka.
+
+    The event is sent by a background task in the next batch; this call does
+    not wait for the broker.
 
     Args:
         event_type_str: Event type string (e.g., "violation", "alert", "check_completed").
         compliance_id: Identifier of the compliance record.
         employee_id: Optional employee identifier related to the event.
         description: Optional human‑readable description.
-        timestamp: Optional timestamp; defaults to ``datetime.utcnow()``.
+        timestamp: Optional timestamp; defaults to the current UTC time.
 
     Returns:
-        ``True`` if the event was successfully sent, ``False`` otherwise.
+        ``True`` if the event was queued, ``False`` otherwise.
     """
+    global _flush_task
+
     if not settings.KAFKA_ENABLE_PRODUCER:
         logger.debug("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False), skipping compliance event")
         return False
+    if not _KAFKA_AVAILABLE:
+        return False
 
     try:
-        # Dynamically import shared kafka to avoid circular imports
-        from shared.kafka import get_producer, create_compliance_event, EventType
-
-        # Map string to EventType enum – extend as needed
-        event_type_map = {
-            "violation": EventType.COMPLIANCE_VIOLATION,
-            "alert": EventType.COMPLIANCE_ALERT,
-            "check_completed": EventType.COMPLIANCE_CHECK_COMPLETED,
-        }
-        event_type = event_type_map.get(event_type_str)
+        event_type = _EVENT_TYPE_MAP.get(event_type_str)
         if not event_type:
-            logger.warning(f"Unknown compliance event type: {event_type_str}")
-            return False
-
-        producer = await get_producer(
-            bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-            client_id=settings.KAFKA_CLIENT_ID,
-        )
-        if not producer or not producer.is_started:
-            logger.warning("Kafka producer not started, skipping compliance event")
+            logger.warning("Unknown compliance event type: %s", event_type_str)
             return False
 
         # Build the event payload using the shared factory
@@ -63,14 +237,13 @@ async def publish_compliance_event(
             compliance_id=compliance_id,
             employee_id=employee_id,
             description=description,
-            timestamp=timestamp or datetime.utcnow(),
+            timestamp=timestamp or datetime.now(_UTC),
         )
-        success = await producer.send_event(settings.KAFKA_COMPLIANCE_TOPIC, event)
-        if success:
-            logger.info(f"Compliance event sent via Kafka: {event_type_str} for id {compliance_id}")
-        else:
-            logger.warning(f"Failed to send compliance event via Kafka: {event_type_str} for id {compliance_id}")
-        return success
+
+        if _flush_task is None or _flush_task.done():
+            _flush_task = asyncio.create_task(_flush_events())
+        _event_queue.put_nowait(event)
+        return True
     except Exception as e:
-        logger.error(f"Error publishing compliance event: {e}")
+        logger.error("Error publishing compliance event: %s", e)
         return False
@@ -4,30 +4,40 @@ Handles all CRUD operations for employee resources.
 """
 
 from typing import Annotated
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Body, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
 
 from app.api.deps import SessionDep
 from app.models.employee import Employee
 from app.schemas.employee import EmployeeCreate, EmployeePublic, EmployeeUpdate
 from app.core.logging import get_logger
-from app.services.employee_events import publish_employee_event
-from sqlmodel import select  # type: ignore
+from app.services.employee_events import (
+    enqueue_employee_event,
+    enqueue_employee_events,
+)
+from sqlmodel import Session, select  # type: ignore
 
 logger = get_logger(__name__)
 
+# Most employees one bulk request may create; keeps it to one INSERT statement
+_MAX_BULK_EMPLOYEES = 100
+
 # Create router with prefix and tags for better organization
+# orjson encodes responses in C; it ships with fastapi[all]
 router = APIRouter(
     prefix="/employees",
     tags=["employees"],
     responses={404: {"description": "Employee not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
 @router.post("/", response_model=EmployeePublic, status_code=201)
 async def create_employee(
     employee: EmployeeCreate, 
-    session: SessionDep,
-    background_tasks: BackgroundTasks
+    session: SessionDep
 ) -> Employee:
     """
     Create a new employee.
@@ -35,52 +45,127 @@ async def create_employee(
     Args:
         employee: Employee data from request body
         session: Database session (injected)
-        background_tasks: Background tasks for async operations
 
     Returns:
         Created employee with generated ID
     """
-    logger.info(f"Creating new employee: {employee.name}")
+    logger.info("Creating new employee: %s", employee.name)
     db_employee = Employee.model_validate(employee)
     session.add(db_employee)
     session.commit()
-    session.refresh(db_employee)
-    logger.info(f"Employee created successfully with ID: {db_employee.id}")
+    logger.info("Employee created successfully with ID: %s", db_employee.id)
     
     # Publish employee created event (async, non-blocking)
-    background_tasks.add_task(
-        publish_employee_event,
-        "created",
-        db_employee.id,
-        db_employee.name,
-        db_employee.age
+    enqueue_employee_event(
+        "created", db_employee.id, db_employee.name, db_employee.age
     )
     
     return db_employee
 
 
 
+def _insert_employees(session: Session, rows: list[dict]) -> int:
+    """
+    Insert employees with one multi-row INSERT and commit.
+
+    Runs through run_in_threadpool so the database round trip does not
+    block the event loop.
+
+    Args:
+        session: Database session
+        rows: Column values for each employee
+
+    Returns:
+        ID of the first inserted employee
+    """
+    result = session.execute(insert(Employee.__table__), rows)
+    session.commit()
+    return result.lastrowid
+
+
+@router.post("/bulk", response_model=list[EmployeePublic], status_code=201)
+async def create_employees_bulk(
+    employees: Annotated[
+        list[EmployeeCreate], Body(min_length=1, max_length=_MAX_BULK_EMPLOYEES)
+    ],
+    session: SessionDep
+) -> list[EmployeePublic]:
+    """
+    Create several employees in a single transaction.
+
+    The rows go to MySQL as one executemany, which the driver sends as a
+    single multi-row INSERT. MySQL gives the rows of one such statement
+    consecutive AUTO_INCREMENT IDs and reports the first, so the IDs are
+    known without reading the rows back.
+
+    Args:
+        employees: List of employee data from request body (1 to 100)
+        session: Database session (injected)
+
+    Returns:
+        Created employees with generated IDs, in request order
+    """
+    logger.info("Creating %s employee(s) in bulk", len(employees))
+    rows = [employee.model_dump() for employee in employees]
+    first_id = await run_in_threadpool(_insert_employees, session, rows)
+
+    created = [
+        EmployeePublic(id=first_id + offset, **row) for offset, row in enumerate(rows)
+    ]
+    logger.info("%s employee(s) created successfully", len(created))
+
+    # Publish all created events as one Kafka batch (async, non-blocking)
+    enqueue_employee_events("created", [(e.id, e.name, e.age) for e in created])
+
+    return created
+
+
 @router.get("/", response_model=list[EmployeePublic])
 def read_employees(
     session: SessionDep,
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 100,
-) -> list[Employee]:
+    after_id: int | None = None,
+    ids: Annotated[list[int] | None, Query(max_length=100)] = None,
+) -> ORJSONResponse:
     """
-    Retrieve a list of employees with pagination.
+    Retrieve a list of employees with pagination, ordered by ID.
+
+    Prefer keyset pagination for large tables: pass the last ID of the
+    previous page as after_id instead of a growing offset. That seeks
+    straight to the next page on the primary key, while OFFSET has to scan
+    and discard every skipped row.
+
+    Only the public columns are selected and the rows are serialized as-is,
+    skipping ORM instances and per-row EmployeePublic validation.
 
     Args:
         session: Database session (injected)
         offset: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100, max: 100)
+        after_id: Only return employees with an ID greater than this
+        ids: Only return employees with these IDs (repeat the parameter,
+            max 100); lets other services look up many employees in one call
 
     Returns:
         List of employees
     """
-    logger.info(f"Fetching employees with offset={offset}, limit={limit}")
-    employees = session.exec(select(Employee).offset(offset).limit(limit)).all()
-    logger.info(f"Retrieved {len(employees)} employee(s)")
-    return list(employees)
+    logger.info(
+        "Fetching employees with offset=%s, limit=%s, after_id=%s",
+        offset,
+        limit,
+        after_id,
+    )
+    query = select(Employee.id, Employee.name, Employee.age)
+    if after_id is not None:
+        query = query.where(Employee.id > after_id)
+    if ids:
+        query = query.where(Employee.id.in_(ids))
+    rows = session.exec(query.order_by(Employee.id).offset(offset).limit(limit)).all()
+    logger.info("Retrieved %s employee(s)", len(rows))
+    return ORJSONResponse(
+        [{"id": id_, "name": name, "age": age} for id_, name, age in rows]
+    )
 
 
 @router.get("/{employee_id}", response_model=EmployeePublic)
@@ -98,12 +183,12 @@ def read_employee(employee_id: int, session: SessionDep) -> Employee:
     Raises:
         HTTPException: 404 if employee not found
     """
-    logger.info(f"Fetching employee with ID: {employee_id}")
+    logger.info("Fetching employee with ID: %s", employee_id)
     employee = session.get(Employee, employee_id)
     if not employee:
-        logger.warning(f"Employee with ID {employee_id} not found")
+        logger.warning("Employee with ID %s not found", employee_id)
         raise HTTPException(status_code=404, detail="Employee not found")
-    logger.info(f"Employee found: {employee.name}")
+    logger.info("Employee found: %s", employee.name)
     return employee
 
 
@@ -111,8 +196,7 @@ def read_employee(employee_id: int, session: SessionDep) -> Employee:
 async def update_employee(
     employee_id: int, 
     employee: EmployeeUpdate, 
-    session: SessionDep,
-    background_tasks: BackgroundTasks
+    session: SessionDep
 ) -> Employee:
     """
     Update an existing employee (partial update).
@@ -121,7 +205,6 @@ async def update_employee(
         employee_id: The ID of the employee to update
         employee: Fields to update (only provided fields will be updated)
         session: Database session (injected)
-        background_tasks: Background tasks for async operations
 
     Returns:
         Updated employee data
@@ -129,27 +212,22 @@ async def update_employee(
     Raises:
         HTTPException: 404 if employee not found
     """
-    logger.info(f"Attempting to update employee with ID: {employee_id}")
+    logger.info("Attempting to update employee with ID: %s", employee_id)
     employee_db = session.get(Employee, employee_id)
     if not employee_db:
-        logger.warning(f"Employee with ID {employee_id} not found for update")
+        logger.warning("Employee with ID %s not found for update", employee_id)
         raise HTTPException(status_code=404, detail="Employee not found")
 
     employee_data = employee.model_dump(exclude_unset=True)
-    logger.info(f"Updating employee {employee_id} with data: {employee_data}")
+    logger.info("Updating employee %s with data: %s", employee_id, employee_data)
     employee_db = employee_db.sqlmodel_update(employee_data)
     session.add(employee_db)
     session.commit()
-    session.refresh(employee_db)
-    logger.info(f"Employee with ID {employee_id} updated successfully")
+    logger.info("Employee with ID %s updated successfully", employee_id)
     
     # Publish employee updated event (async, non-blocking)
-    background_tasks.add_task(
-        publish_employee_event,
-        "updated",
-        employee_db.id,
-        employee_db.name,
-        employee_db.age
+    enqueue_employee_event(
+        "updated", employee_db.id, employee_db.name, employee_db.age
     )
     
     return employee_db
@@ -158,8 +236,7 @@ async def update_employee(
 @router.delete("/{employee_id}")
 async def delete_employee(
     employee_id: int, 
-    session: SessionDep,
-    background_tasks: BackgroundTasks
+    session: SessionDep
 ) -> dict:
     """
     Delete an employee.
@@ -167,7 +244,6 @@ async def delete_employee(
     Args:
         employee_id: The ID of the employee to delete
         session: Database session (injected)
-        background_tasks: Background tasks for async operations
 
     Returns:
         Success confirmation
@@ -175,10 +251,10 @@ async def delete_employee(
     Raises:
         HTTPException: 404 if employee not found
     """
-    logger.info(f"Attempting to delete employee with ID: {employee_id}")
+    logger.info("Attempting to delete employee with ID: %s", employee_id)
     employee = session.get(Employee, employee_id)
     if not employee:
-        logger.warning(f"Employee with ID {employee_id} not found for deletion")
+        logger.warning("Employee with ID %s not found for deletion", employee_id)
         raise HTTPException(status_code=404, detail="Employee not found")
     
     # Capture data before deletion for event
@@ -187,15 +263,9 @@ async def delete_employee(
     
     session.delete(employee)
     session.commit()
-    logger.info(f"Employee with ID {employee_id} deleted successfully")
+    logger.info("Employee with ID %s deleted successfully", employee_id)
     
     # Publish employee deleted event (async, non-blocking)
-    background_tasks.add_task(
-        publish_employee_event,
-        "deleted",
-        employee_id,
-        employee_name,
-        employee_age
-    )
+    enqueue_employee_event("deleted", employee_id, employee_name, employee_age)
     
     return {"ok": True}
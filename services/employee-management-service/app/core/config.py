@@ -47,6 +47,8 @@ class Settings(BaseSettings):
     JWT_ISSUER: str | None = (
         None  # Set to None to skip issuer validation, or set to expected issuer
     )
+    TOKEN_CACHE_TTL_SECONDS: int = 60  # Max time a decoded token is reused
+    TOKEN_CACHE_MAX_SIZE: int = 4096
 
     # Security Settings (for future use)
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
@@ -58,6 +60,8 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_EMPLOYEE_TOPIC: str = "employee-queue"
     KAFKA_CLIENT_ID: str = "employee-management-service"
+    KAFKA_EVENT_QUEUE_MAX_SIZE: int = 10000  # Queued events before new ones drop
+    KAFKA_EVENT_WORKER_BATCH: int = 100  # Queued items the worker takes per pass
 
 
     @property
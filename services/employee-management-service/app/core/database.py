@@ -56,8 +56,12 @@ def get_session() -> Generator[Session, None, None]:
     Dependency that provides a database session.
     Automatically handles session lifecycle and cleanup.
 
+    Objects are not expired on commit, so handlers can return or publish a
+    row they just wrote without reloading it. MySQL has no RETURNING clause
+    to fold that reload into the write itself.
+
     Yields:
         Session: SQLModel database session
     """
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
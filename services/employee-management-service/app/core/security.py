@@ -3,14 +3,19 @@ Security module for JWT authentication using JWKS endpoint.
 Implements token validation, role/permission extraction for Asgardeo.
 """
 
+import hashlib
 import json
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Annotated, Any
 from datetime import datetime, timedelta
 import jwt
 from jwt import PyJWKClient
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -28,23 +33,162 @@ jwks_client = PyJWKClient(
 )
 
 
-class TokenData(BaseModel):
+def _get_signing_key(token: str) -> Any:
+    """
+    Resolve the public key for a token from its kid header.
+
+    get_signing_key_from_jwt decodes the whole token (header and payload) just
+    to read the kid; parsing only the header and going straight to the
+    client's per-kid cache (cache_keys=True) avoids that on every request.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Public key to verify the token signature with
+    """
+    kid = jwt.get_unverified_header(token).get("kid")
+    if kid is None:
+        return jwks_client.get_signing_key_from_jwt(token).key
+    return jwks_client.get_signing_key(kid).key
+
+
+@dataclass(slots=True)
+class TokenData:
     """
     Decoded token data structure.
     Contains user information, roles, and permissions from JWT.
+
+    A plain slotted dataclass rather than a Pydantic model: it is built on
+    every authenticated request from claims PyJWT has already verified, so
+    there is nothing left to validate.
     """
 
     sub: str  # Subject (user ID)
     username: str | None = None
     email: str | None = None
-    roles: list[str] = []
-    permissions: list[str] = []
-    groups: list[str] = []
+    roles: list[str] = field(default_factory=list)
+    permissions: list[str] = field(default_factory=list)
+    groups: list[str] = field(default_factory=list)
     iss: str | None = None  # Issuer
     aud: str | list[str] | None = None  # Audience
     exp: int | None = None  # Expiration
     iat: int | None = None  # Issued at
-    raw_claims: dict[str, Any] = {}  # All other claims
+    raw_claims: dict[str, Any] = field(default_factory=dict)  # All other claims
+
+
+# Decode options and audience/issuer checks only depend on settings, so the
+# jwt.decode call is configured once at import instead of on every request.
+_DECODE_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_iat": True,
+    "verify_aud": settings.JWT_AUDIENCE is not None,
+    "verify_iss": settings.JWT_ISSUER is not None,
+}
+_decode_kwargs: dict[str, Any] = {}
+if settings.JWT_AUDIENCE:
+    _decode_kwargs["audience"] = settings.JWT_AUDIENCE
+if settings.JWT_ISSUER:
+    _decode_kwargs["issuer"] = settings.JWT_ISSUER
+_decode_jwt = partial(
+    jwt.decode, algorithms=["RS256"], options=_DECODE_OPTIONS, **_decode_kwargs
+)
+
+
+# Cache of successfully decoded tokens: token digest -> (expires_at, TokenData).
+# Lets repeated calls with the same bearer token skip RS256 verification.
+_token_cache: dict[bytes, tuple[float, TokenData]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash the raw token so the cache never holds bearer credentials."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_token(key: bytes) -> TokenData | None:
+    """Return cached TokenData for the key if it has not expired yet."""
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, token_data = entry
+    if expires_at <= time.time():
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+    return token_data
+
+
+def _cache_token(key: bytes, token_data: TokenData) -> None:
+    """
+    Cache decoded TokenData until the earlier of the cache TTL and token expiry.
+
+    When the cache is full, expired entries are purged first and the oldest
+    entry is evicted if that does not free a slot.
+    """
+    now = time.time()
+    ttl = float(settings.TOKEN_CACHE_TTL_SECONDS)
+    if token_data.exp is not None:
+        ttl = min(ttl, token_data.exp - now)
+    if ttl <= 0:
+        return
+
+    with _token_cache_lock:
+        if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+            expired = [k for k, (exp, _) in _token_cache.items() if exp <= now]
+            for k in expired:
+                del _token_cache[k]
+            if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+                _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (now + ttl, token_data)
+
+
+# Claims checked, in order, for each TokenData list field; the first present wins
+_CLAIM_SOURCES = (
+    ("roles", ("roles", "role", "groups")),
+    ("permissions", ("permissions", "scope")),
+    ("groups", ("groups",)),
+)
+
+
+def _listify(value: Any) -> list:
+    """Wrap a single claim value in a list; lists are returned unchanged."""
+    return value if isinstance(value, list) else [value]
+
+
+def _extract_claim_lists(payload: dict[str, Any]) -> dict[str, list]:
+    """
+    Extract roles, permissions and groups from a decoded token payload.
+
+    Args:
+        payload: Verified JWT claims
+
+    Returns:
+        Mapping of TokenData field name to its list of values
+    """
+    extracted: dict[str, list] = {}
+    for field_name, claims in _CLAIM_SOURCES:
+        values: list = []
+        for claim in claims:
+            if claim not in payload:
+                continue
+            value = payload[claim]
+            if claim == "scope":
+                # OAuth2 scopes as permissions
+                values = value.split() if isinstance(value, str) else value
+            elif field_name == "roles" and claim == "groups":
+                # Sometimes roles are in groups; path-style groups ("/x") are not
+                values = [g for g in _listify(value) if g[:1] != "/"]
+            else:
+                values = _listify(value)
+            break
+        # Interned values match the interned required sets by identity
+        extracted[field_name] = [
+            sys.intern(v) if isinstance(v, str) else v for v in values
+        ]
+    return extracted
 
 
 def decode_token(token: str) -> TokenData:
@@ -60,112 +204,31 @@ def decode_token(token: str) -> TokenData:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    cache_key = _token_cache_key(token)
+    cached = _get_cached_token(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Get the signing key from JWKS
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-
-        # Prepare decode options
-        decode_options = {
-            "verify_signature": True,
-            "verify_exp": True,
-            "verify_iat": True,
-            "verify_aud": settings.JWT_AUDIENCE is not None,
-            "verify_iss": settings.JWT_ISSUER is not None,
-        }
+        signing_key = _get_signing_key(token)
 
         # Decode and validate the token with optional audience and issuer
-        if settings.JWT_AUDIENCE and settings.JWT_ISSUER:
-            # Validate both audience and issuer
-            payload = jwt.decode(
-                token,
-                signing_key.key,
-                algorithms=["RS256"],
-                audience=settings.JWT_AUDIENCE,
-                issuer=settings.JWT_ISSUER,
-                options=decode_options,
-            )
-        elif settings.JWT_AUDIENCE:
-            # Validate only audience
-            payload = jwt.decode(
-                token,
-                signing_key.key,
-                algorithms=["RS256"],
-                audience=settings.JWT_AUDIENCE,
-                options=decode_options,
-            )
-        elif settings.JWT_ISSUER:
-            # Validate only issuer
-            payload = jwt.decode(
-                token,
-                signing_key.key,
-                algorithms=["RS256"],
-                issuer=settings.JWT_ISSUER,
-                options=decode_options,
-            )
-        else:
-            # No audience or issuer validation
-            payload = jwt.decode(
-                token,
-                signing_key.key,
-                algorithms=["RS256"],
-                options=decode_options,
-            )
+        payload = _decode_jwt(token, signing_key)
 
-        logger.info(f"Token decoded successfully for subject: {payload.get('sub')}")
+        logger.info("Token decoded successfully for subject: %s", payload.get("sub"))
 
-        # Extract roles from various possible claim locations
-        roles = []
-        if "roles" in payload:
-            roles = (
-                payload["roles"]
-                if isinstance(payload["roles"], list)
-                else [payload["roles"]]
-            )
-        elif "role" in payload:
-            roles = (
-                payload["role"]
-                if isinstance(payload["role"], list)
-                else [payload["role"]]
-            )
-        elif "groups" in payload:
-            # Sometimes roles are in groups
-            groups = (
-                payload["groups"]
-                if isinstance(payload["groups"], list)
-                else [payload["groups"]]
-            )
-            roles = [g for g in groups if not g.startswith("/")]
-
-        # Extract permissions
-        permissions = []
-        if "permissions" in payload:
-            permissions = (
-                payload["permissions"]
-                if isinstance(payload["permissions"], list)
-                else [payload["permissions"]]
-            )
-        elif "scope" in payload:
-            # OAuth2 scopes as permissions
-            scopes = payload["scope"]
-            permissions = scopes.split() if isinstance(scopes, str) else scopes
-
-        # Extract groups
-        groups = []
-        if "groups" in payload:
-            groups = (
-                payload["groups"]
-                if isinstance(payload["groups"], list)
-                else [payload["groups"]]
-            )
+        # Extract roles, permissions and groups from their claim locations
+        claim_lists = _extract_claim_lists(payload)
 
         # Create TokenData object
         token_data = TokenData(
             sub=payload.get("sub", ""),
             username=payload.get("username") or payload.get("preferred_username"),
             email=payload.get("email"),
-            roles=roles,
-            permissions=permissions,
-            groups=groups,
+            roles=claim_lists["roles"],
+            permissions=claim_lists["permissions"],
+            groups=claim_lists["groups"],
             iss=payload.get("iss"),
             aud=payload.get("aud"),
             exp=payload.get("exp"),
@@ -173,6 +236,7 @@ def decode_token(token: str) -> TokenData:
             raw_claims=payload,
         )
 
+        _cache_token(cache_key, token_data)
         return token_data
 
     except jwt.ExpiredSignatureError:
@@ -183,14 +247,14 @@ def decode_token(token: str) -> TokenData:
             headers={"WWW-Authenticate": "Bearer"},
         )
     except jwt.InvalidTokenError as e:
-        logger.warning(f"Invalid token: {str(e)}")
+        logger.warning("Invalid token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
     except Exception as e:
-        logger.error(f"Error decoding token: {str(e)}")
+        logger.error("Error decoding token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -260,16 +324,17 @@ def require_role(*required_roles: str):
         Dependency function that validates roles
     """
 
+    required = frozenset(sys.intern(r) for r in required_roles)
+
     async def check_roles(
         current_user: Annotated[TokenData, Depends(get_current_active_user)],
     ) -> TokenData:
-        user_roles = set(current_user.roles)
-        required = set(required_roles)
-
-        if not user_roles.intersection(required):
+        if required.isdisjoint(current_user.roles):
             logger.warning(
-                f"User {current_user.sub} lacks required roles. "
-                f"Has: {user_roles}, Required: {required}"
+                "User %s lacks required roles. Has: %s, Required: %s",
+                current_user.sub,
+                current_user.roles,
+                set(required),
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -301,16 +366,17 @@ def require_permission(*required_permissions: str):
         Dependency function that validates permissions
     """
 
+    required = frozenset(sys.intern(p) for p in required_permissions)
+
     async def check_permissions(
         current_user: Annotated[TokenData, Depends(get_current_active_user)],
     ) -> TokenData:
-        user_perms = set(current_user.permissions)
-        required = set(required_permissions)
-
-        if not user_perms.intersection(required):
+        if required.isdisjoint(current_user.permissions):
             logger.warning(
-                f"User {current_user.sub} lacks required permissions. "
-                f"Has: {user_perms}, Required: {required}"
+                "User %s lacks required permissions. Has: %s, Required: %s",
+                current_user.sub,
+                current_user.permissions,
+                set(required),
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -333,15 +399,16 @@ def require_all_roles(*required_roles: str):
         Dependency function that validates user has all roles
     """
 
+    required = frozenset(sys.intern(r) for r in required_roles)
+
     async def check_all_roles(
         current_user: Annotated[TokenData, Depends(get_current_active_user)],
     ) -> TokenData:
-        user_roles = set(current_user.roles)
-        required = set(required_roles)
-
-        if not required.issubset(user_roles):
-            missing = required - user_roles
-            logger.warning(f"User {current_user.sub} missing required roles: {missing}")
+        missing = required.difference(current_user.roles)
+        if missing:
+            logger.warning(
+                "User %s missing required roles: %s", current_user.sub, missing
+            )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Missing required roles: {', '.join(missing)}",
@@ -12,6 +12,7 @@ from app.core.database import create_db_and_tables
 from app.core.logging import get_logger
 from app.api.routes.employees import router as employees_router
 from app.api.routes.auth import router as auth_router
+from app.services.employee_events import start_event_worker, stop_event_worker
 
 logger = get_logger(__name__)
 
@@ -49,6 +50,7 @@ async def lifespan(_: FastAPI):
     else:
         logger.info("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False)")
     
+    start_event_worker()
     logger.info("Application startup complete")
 
     yield
@@ -56,6 +58,9 @@ async def lifespan(_: FastAPI):
     # Shutdown
     logger.info("Application shutting down...")
     
+    # Publish queued employee events before the producer goes away
+    await stop_event_worker()
+    
     # Stop Kafka producer
     if settings.KAFKA_ENABLE_PRODUCER:
         try:
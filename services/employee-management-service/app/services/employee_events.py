@@ -1,14 +1,66 @@
 """
 Employee event publishing utilities.
 Handles async Kafka event publishing for employee lifecycle events.
+
+Routes enqueue events with enqueue_employee_event(s); a single long-lived
+worker task started with the application drains the queue and publishes them.
+The queue is bounded, so if Kafka falls behind new events are dropped (and
+logged) rather than buffered without limit.
 """
 
+import asyncio
+import sys
+from pathlib import Path
 from typing import Optional
 from app.core.logging import get_logger
 from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# Directory holding the shared package (the same one main.py adds at startup);
+# imported here once so the publishers don't redo it per event
+_SHARED_PATH = str(Path(__file__).resolve().parents[3])
+if _SHARED_PATH not in sys.path:
+    sys.path.insert(0, _SHARED_PATH)
+
+try:
+    from shared.kafka import EventType, create_employee_event, get_producer
+
+    _KAFKA_AVAILABLE = True
+    _EVENT_TYPE_MAP = {
+        "created": EventType.EMPLOYEE_CREATED,
+        "updated": EventType.EMPLOYEE_UPDATED,
+        "deleted": EventType.EMPLOYEE_TERMINATED,
+    }
+except ImportError as e:
+    logger.warning("Kafka support unavailable, employee events disabled: %s", e)
+    _KAFKA_AVAILABLE = False
+    _EVENT_TYPE_MAP = {}
+
+# Queued (event_type_str, [(employee_id, name, age), ...]) items, or None to stop
+_event_queue: asyncio.Queue = asyncio.Queue(
+    maxsize=settings.KAFKA_EVENT_QUEUE_MAX_SIZE
+)
+_event_worker_task: Optional[asyncio.Task] = None
+
+
+def _build_employee_event(event_type, event_type_str: str, employee_id: int, name: str):
+    """Build the shared employee event payload for one employee."""
+    # Parse name into first/last (simple split for now)
+    name_parts = name.split(" ", 1)
+    first_name = name_parts[0]
+    last_name = name_parts[1] if len(name_parts) > 1 else ""
+    
+    return create_employee_event(
+        source_service=settings.APP_NAME,
+        event_type=event_type,
+        employee_id=employee_id,
+        email=f"employee{employee_id}@company.com",  # Placeholder
+        first_name=first_name,
+        last_name=last_name,
+        status="active" if event_type_str != "deleted" else "terminated",
+    )
+
 
 async def publish_employee_event(
     event_type_str: str,
@@ -34,24 +86,13 @@ async def publish_employee_event(
     if not settings.KAFKA_ENABLE_PRODUCER:
         logger.debug("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False), skipping employee event")
         return False
+    if not _KAFKA_AVAILABLE:
+        return False
     
     try:
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-        
-        from shared.kafka import get_producer, create_employee_event, EventType
-        
-        # Map string to EventType
-        event_type_map = {
-            "created": EventType.EMPLOYEE_CREATED,
-            "updated": EventType.EMPLOYEE_UPDATED,
-            "deleted": EventType.EMPLOYEE_TERMINATED,
-        }
-        
-        event_type = event_type_map.get(event_type_str)
+        event_type = _EVENT_TYPE_MAP.get(event_type_str)
         if not event_type:
-            logger.warning(f"Unknown employee event type: {event_type_str}")
+            logger.warning("Unknown employee event type: %s", event_type_str)
             return False
         
         producer = await get_producer(
@@ -63,29 +104,210 @@ async def publish_employee_event(
             logger.warning("Kafka producer not started, skipping employee event")
             return False
         
-        # Parse name into first/last (simple split for now)
-        name_parts = name.split(" ", 1)
-        first_name = name_parts[0]
-        last_name = name_parts[1] if len(name_parts) > 1 else ""
-        
-        event = create_employee_event(
-            source_service=settings.APP_NAME,
-            event_type=event_type,
-            employee_id=employee_id,
-            email=f"employee{employee_id}@company.com",  # Placeholder
-            first_name=first_name,
-            last_name=last_name,
-            status="active" if event_type_str != "deleted" else "terminated",
-        )
+        event = _build_employee_event(event_type, event_type_str, employee_id, name)
         
         success = await producer.send_event(settings.KAFKA_EMPLOYEE_TOPIC, event)
         if success:
-            logger.info(f"Employee event sent via Kafka: {event_type_str} for employee {employee_id}")
+            logger.info(
+                "Employee event sent via Kafka: %s for employee %s",
+                event_type_str,
+                employee_id,
+            )
             return True
         else:
-            logger.warning(f"Failed to send employee event via Kafka: {event_type_str} for employee {employee_id}")
+            logger.warning(
+                "Failed to send employee event via Kafka: %s for employee %s",
+                event_type_str,
+                employee_id,
+            )
             return False
             
     except Exception as e:
-        logger.error(f"Error publishing employee event: {e}")
+        logger.error("Error publishing employee event: %s", e)
         return False
+
+
+async def publish_employee_events_batch(
+    event_type_str: str,
+    employees: list[tuple[int, str, Optional[int]]],
+) -> int:
+    """
+    Publish one lifecycle event per employee to Kafka in a single batch.
+    
+    All events are handed to the producer before any acknowledgment is
+    awaited, so a bulk write costs one broker round-trip instead of one per
+    employee.
+    
+    Args:
+        event_type_str: Event type string ('created', 'updated', 'deleted')
+        employees: (employee_id, name, age) tuples
+    
+    Returns:
+        Number of events published successfully
+    """
+    if not settings.KAFKA_ENABLE_PRODUCER:
+        logger.debug("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False), skipping employee events")
+        return 0
+    if not _KAFKA_AVAILABLE:
+        return 0
+    
+    try:
+        event_type = _EVENT_TYPE_MAP.get(event_type_str)
+        if not event_type:
+            logger.warning("Unknown employee event type: %s", event_type_str)
+            return 0
+        
+        producer = await get_producer(
+            bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
+            client_id=settings.KAFKA_CLIENT_ID
+        )
+        
+        if not producer or not producer.is_started:
+            logger.warning("Kafka producer not started, skipping employee events")
+            return 0
+        
+        events = [
+            _build_employee_event(event_type, event_type_str, employee_id, name)
+            for employee_id, name, _age in employees
+        ]
+        sent = await producer.send_batch(settings.KAFKA_EMPLOYEE_TOPIC, events)
+        logger.info(
+            "Employee events sent via Kafka: %s x%s/%s",
+            event_type_str,
+            sent,
+            len(events),
+        )
+        return sent
+            
+    except Exception as e:
+        logger.error("Error publishing employee events: %s", e)
+        return 0
+
+
+def enqueue_employee_event(
+    event_type_str: str,
+    employee_id: int,
+    name: str,
+    age: Optional[int] = None,
+) -> bool:
+    """
+    Queue one employee lifecycle event for the background worker.
+    
+    Args:
+        event_type_str: Event type string ('created', 'updated', 'deleted')
+        employee_id: Employee ID
+        name: Employee name
+        age: Employee age (optional)
+    
+    Returns:
+        True if the event was queued, False if the queue is full
+    """
+    return _put_event(event_type_str, [(employee_id, name, age)])
+
+
+def enqueue_employee_events(
+    event_type_str: str,
+    employees: list[tuple[int, str, Optional[int]]],
+) -> bool:
+    """
+    Queue lifecycle events for several employees, published as one batch.
+    
+    Args:
+        event_type_str: Event type string ('created', 'updated', 'deleted')
+        employees: (employee_id, name, age) tuples
+    
+    Returns:
+        True if the events were queued (or there were none), False if the
+        queue is full
+    """
+    if not employees:
+        return True
+    return _put_event(event_type_str, employees)
+
+
+def _put_event(
+    event_type_str: str,
+    employees: list[tuple[int, str, Optional[int]]],
+) -> bool:
+    """Put an item on the event queue without waiting, dropping it if full."""
+    try:
+        _event_queue.put_nowait((event_type_str, employees))
+        return True
+    except asyncio.QueueFull:
+        logger.warning(
+            "Employee event queue full, dropping %s event for %s employee(s)",
+            event_type_str,
+            len(employees),
+        )
+        return False
+
+
+async def _publish_queued(
+    event_type_str: str,
+    employees: list[tuple[int, str, Optional[int]]],
+) -> None:
+    """Publish one run of same-type queued events."""
+    try:
+        if len(employees) == 1:
+            await publish_employee_event(event_type_str, *employees[0])
+        else:
+            await publish_employee_events_batch(event_type_str, employees)
+    except Exception as e:
+        logger.error("Error in employee event worker: %s", e)
+
+
+async def _event_worker() -> None:
+    """
+    Publish queued employee events until a None item is received.
+    
+    Each pass takes whatever is already queued (up to KAFKA_EVENT_WORKER_BATCH
+    items) and merges consecutive items of the same event type, so a burst
+    of writes is sent as a few batches. Queue order is preserved.
+    """
+    while True:
+        items = [await _event_queue.get()]
+        while (
+            items[-1] is not None
+            and len(items) < settings.KAFKA_EVENT_WORKER_BATCH
+            and not _event_queue.empty()
+        ):
+            items.append(_event_queue.get_nowait())
+        
+        run_type, run = None, []
+        for item in items:
+            if item is None:
+                break
+            event_type_str, employees = item
+            if event_type_str != run_type and run:
+                await _publish_queued(run_type, run)
+                run = []
+            run_type = event_type_str
+            run.extend(employees)
+        if run:
+            await _publish_queued(run_type, run)
+        
+        if items[-1] is None:
+            return
+
+
+def start_event_worker() -> None:
+    """Start the employee event worker. Called at application startup."""
+    global _event_worker_task
+    
+    if _event_worker_task is None or _event_worker_task.done():
+        _event_worker_task = asyncio.create_task(_event_worker())
+
+
+async def stop_event_worker() -> None:
+    """
+    Publish any queued employee events and stop the worker.
+    Called at application shutdown, before the Kafka producer is closed.
+    """
+    global _event_worker_task
+    
+    if _event_worker_task is None:
+        return
+    
+    await _event_queue.put(None)
+    await _event_worker_task
+    _event_worker_task = None
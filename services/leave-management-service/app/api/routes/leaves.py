@@ -4,75 +4,214 @@ Handles all CRUD operations for leave requests and status management.
 """
 
 from typing import Annotated
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
-from datetime import datetime, timezone
-from sqlmodel import select
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
 from app.models.leave import Leave, LeaveStatus
 from app.schemas.leave import LeaveCreate, LeavePublic, LeaveStatusUpdate
 from app.core.logging import get_logger
-from app.services.employee_service import verify_employee_exists
+from app.core.security import OptionalUser, TokenData, token_employee_id
+from app.services.employee_service import verify_employee_exists_batched
 from app.services.leave_events import publish_leave_event
 
 logger = get_logger(__name__)
 
+# Status filter lookup and its error message, built once
+_ALLOWED_STATUSES = {s.value: s for s in LeaveStatus}
+_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(_ALLOWED_STATUSES)}"
+
+# Columns exposed by LeavePublic, used to serialize list pages directly
+_PUBLIC_FIELDS = frozenset(LeavePublic.model_fields)
+
 # Create router with prefix and tags for better organization
 router = APIRouter(
     prefix="/leaves",
     tags=["leaves"],
     responses={404: {"description": "Leave not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
+def _page_leaves(
+    session: Session,
+    query,
+    offset: int,
+    limit: int,
+    after: int | None,
+) -> tuple[list[Leave], int | None]:
+    """
+    Run a leave list query with keyset or offset pagination, ordered by id.
+
+    One extra row is fetched to tell whether another page exists; if so its
+    cursor (the last returned id) is returned alongside the page.
+
+    Args:
+        session: Database session
+        query: Filtered select(Leave) statement
+        offset: Number of records to skip
+        limit: Maximum number of records to return
+        after: Only return leaves with an id greater than this
+
+    Returns:
+        One page of leaves and the next cursor (None on the last page)
+    """
+    if after is not None:
+        query = query.where(Leave.id > after)
+    leaves = session.exec(
+        query.order_by(Leave.id).offset(offset).limit(limit + 1)
+    ).all()
+    if len(leaves) > limit:
+        leaves = leaves[:limit]
+        return leaves, leaves[-1].id
+    return leaves, None
+
+
+def _leaves_response(leaves: list[Leave], next_cursor: int | None) -> ORJSONResponse:
+    """
+    Serialize a page of leaves straight to JSON.
+
+    The rows come from the database and already match LeavePublic, so they
+    are dumped to its fields directly instead of being re-validated through
+    the response model.
+
+    Args:
+        leaves: One page of leaves
+        next_cursor: Value for the X-Next-Cursor header, if there is a next page
+
+    Returns:
+        JSON response with the page and its cursor header
+    """
+    headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor is not None else None
+    return ORJSONResponse(
+        [leave.model_dump(include=_PUBLIC_FIELDS) for leave in leaves],
+        headers=headers,
+    )
+
+
+def _save_leave(session: Session, leave: Leave) -> None:
+    """
+    Add and commit a leave, then reload its server-generated columns.
+
+    This blocks on the database, so async handlers call it through
+    run_in_threadpool to keep the event loop free.
+
+    Args:
+        session: Database session
+        leave: Leave to persist
+    """
+    session.add(leave)
+    session.commit()
+    session.refresh(leave)
+
+
+def _change_leave_status(
+    session: Session,
+    leave_id: int,
+    allowed_from: tuple[LeaveStatus, ...] | None,
+    **values,
+) -> bool:
+    """
+    Update a leave in one statement, guarded by its current status.
+
+    The transition check is part of the WHERE clause, so the update is a
+    single round trip and cannot race with a concurrent status change. The
+    MySQL driver reports matched (not changed) rows, so a no-op update of a
+    matching leave still counts.
+
+    Args:
+        session: Database session
+        leave_id: The ID of the leave to update
+        allowed_from: Statuses the leave may currently have (None for any)
+        **values: Column values to set
+
+    Returns:
+        True if the leave was updated, False if it is missing or its status
+        does not allow the change
+    """
+    statement = (
+        update(Leave)
+        .where(Leave.id == leave_id)
+        .values(**values, updated_at=datetime.utcnow())
+    )
+    if allowed_from is not None:
+        statement = statement.where(Leave.status.in_(allowed_from))
+    result = session.exec(statement)
+    session.commit()
+    return result.rowcount > 0
+
+
+async def _employee_exists(employee_id: int, user: TokenData | None) -> bool:
+    """
+    Check that an employee exists, trusting the caller's token when it can.
+
+    A validated token whose employee ID claim matches already proves the
+    employee exists, so only other callers (no token, or acting for someone
+    else) pay for the Employee Service lookup.
+
+    Args:
+        employee_id: The ID of the employee to check
+        user: Decoded bearer token of the caller, if one was sent
+
+    Returns:
+        True if the employee exists
+    """
+    if user is not None and token_employee_id(user) == employee_id:
+        return True
+    return await verify_employee_exists_batched(employee_id)
+
+
+def _get_leave_status(session: Session, leave_id: int) -> LeaveStatus | None:
+    """Return a leave's current status, or None if it does not exist."""
+    return session.exec(select(Leave.status).where(Leave.id == leave_id)).first()
+
 
 @router.post("/", response_model=LeavePublic, status_code=201)
 async def create_leave(
     leave: LeaveCreate, 
     session: SessionDep,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    user: OptionalUser,
 ) -> Leave:
     """
     Create a new leave request.
 
-    - Validates that the employee exists via employee service
-    - Validates that start_date is before end_date
+    - Validates that the employee exists (the caller's own employee ID from
+      the token is trusted; anything else is checked with employee service)
+    - start_date before end_date is enforced by LeaveCreate (422 otherwise)
     - Sets initial status to PENDING
 
     Args:
         leave: Leave data from request body
         session: Database session (injected)
         background_tasks: Background tasks for async operations
+        user: Caller's decoded bearer token, if sent (injected)
 
     Returns:
         Created leave request with generated ID
 
     Raises:
-        HTTPException: 400 if validation fails, 404 if employee not found
+        HTTPException: 404 if employee not found
     """
-    logger.info(f"Creating new leave for employee {leave.employee_id}")
-
-    # Validate dates
-    if leave.start_date >= leave.end_date:
-        logger.warning(f"Invalid date range: {leave.start_date} >= {leave.end_date}")
-        raise HTTPException(
-            status_code=400, detail="start_date must be before end_date"
-        )
+    logger.info("Creating new leave for employee %s", leave.employee_id)
 
     # Verify employee exists
-    if not verify_employee_exists(leave.employee_id):
-        logger.warning(f"Employee {leave.employee_id} not found")
+    if not await _employee_exists(leave.employee_id, user):
+        logger.warning("Employee %s not found", leave.employee_id)
         raise HTTPException(status_code=404, detail="Employee not found")
 
     db_leave = Leave.model_validate(leave)
     db_leave.status = LeaveStatus.PENDING
-    db_leave.created_at = datetime.now(timezone.utc)
-    db_leave.updated_at = datetime.now(timezone.utc)
 
-    session.add(db_leave)
-    session.commit()
-    session.refresh(db_leave)
-    logger.info(f"Leave created successfully with ID: {db_leave.id}")
+    await run_in_threadpool(_save_leave, session, db_leave)
+    logger.info("Leave created successfully with ID: %s", db_leave.id)
+
+    # The token's email is the employee's own only when they filed the request
+    own_request = user is not None and token_employee_id(user) == leave.employee_id
     
     # Publish leave created event (async, non-blocking)
     background_tasks.add_task(
@@ -84,7 +223,8 @@ async def create_leave(
         db_leave.start_date,
         db_leave.end_date,
         db_leave.status.value,
-        db_leave.reason
+        db_leave.reason,
+        employee_email=user.email if own_request else None,
     )
     
     return db_leave
@@ -97,37 +237,41 @@ def list_leaves(
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 100,
     status: str | None = None,
-) -> list[Leave]:
+    after: int | None = None,
+) -> ORJSONResponse:
     """
     List all leaves with optional filtering and pagination.
 
+    Results are ordered by id. For deep scrolling pass the X-Next-Cursor
+    response header back as after instead of increasing offset: the cursor
+    seeks straight to the next page, while OFFSET re-reads every skipped row.
+
     Args:
         session: Database session (injected)
         offset: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100, max: 100)
         status: Filter by leave status (optional)
+        after: Cursor; only return leaves with an id greater than this
 
     Returns:
         List of leave requests
     """
-    logger.info(f"Fetching leaves with offset={offset}, limit={limit}, status={status}")
+    logger.info(
+        "Fetching leaves with offset=%s, limit=%s, status=%s", offset, limit, status
+    )
 
     query = select(Leave)
 
     if status:
-        try:
-            status_enum = LeaveStatus(status)
-            query = query.where(Leave.status == status_enum)
-        except ValueError:
-            logger.warning(f"Invalid status filter: {status}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status. Must be one of: {', '.join([s.value for s in LeaveStatus])}",
-            )
+        status_enum = _ALLOWED_STATUSES.get(status)
+        if status_enum is None:
+            logger.warning("Invalid status filter: %s", status)
+            raise HTTPException(status_code=400, detail=_STATUS_ERROR)
+        query = query.where(Leave.status == status_enum)
 
-    leaves = session.exec(query.offset(offset).limit(limit)).all()
-    logger.info(f"Retrieved {len(leaves)} leave(s)")
-    return list(leaves)
+    leaves, next_cursor = _page_leaves(session, query, offset, limit, after)
+    logger.info("Retrieved %s leave(s)", len(leaves))
+    return _leaves_response(leaves, next_cursor)
 
 
 @router.get("/{leave_id}", response_model=LeavePublic)
@@ -145,32 +289,39 @@ def get_leave(leave_id: int, session: SessionDep) -> Leave:
     Raises:
         HTTPException: 404 if leave not found
     """
-    logger.info(f"Fetching leave with ID: {leave_id}")
+    logger.info("Fetching leave with ID: %s", leave_id)
     leave = session.get(Leave, leave_id)
     if not leave:
-        logger.warning(f"Leave with ID {leave_id} not found")
+        logger.warning("Leave with ID %s not found", leave_id)
         raise HTTPException(status_code=404, detail="Leave not found")
-    logger.info(f"Leave found: {leave.id}")
+    logger.info("Leave found: %s", leave.id)
     return leave
 
 
 @router.get("/employee/{employee_id}", response_model=list[LeavePublic])
-def get_employee_leaves(
+async def get_employee_leaves(
     employee_id: int,
     session: SessionDep,
+    user: OptionalUser,
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 100,
     status: str | None = None,
-) -> list[Leave]:
+    after: int | None = None,
+) -> ORJSONResponse:
     """
     Retrieve all leaves for a specific employee.
 
+    Results are ordered by id; use the X-Next-Cursor header as after to page
+    deep into an employee's history (see list_leaves).
+
     Args:
         employee_id: The ID of the employee
         session: Database session (injected)
+        user: Caller's decoded bearer token, if sent (injected)
         offset: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100, max: 100)
         status: Filter by leave status (optional)
+        after: Cursor; only return leaves with an id greater than this
 
     Returns:
         List of leave requests for the employee
@@ -178,29 +329,27 @@ def get_employee_leaves(
     Raises:
         HTTPException: 404 if employee not found
     """
-    logger.info(f"Fetching leaves for employee {employee_id}")
+    logger.info("Fetching leaves for employee %s", employee_id)
 
     # Verify employee exists
-    if not verify_employee_exists(employee_id):
-        logger.warning(f"Employee {employee_id} not found")
+    if not await _employee_exists(employee_id, user):
+        logger.warning("Employee %s not found", employee_id)
         raise HTTPException(status_code=404, detail="Employee not found")
 
     query = select(Leave).where(Leave.employee_id == employee_id)
 
     if status:
-        try:
-            status_enum = LeaveStatus(status)
-            query = query.where(Leave.status == status_enum)
-        except ValueError:
-            logger.warning(f"Invalid status filter: {status}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status. Must be one of: {', '.join([s.value for s in LeaveStatus])}",
-            )
-
-    leaves = session.exec(query.offset(offset).limit(limit)).all()
-    logger.info(f"Retrieved {len(leaves)} leave(s) for employee {employee_id}")
-    return list(leaves)
+        status_enum = _ALLOWED_STATUSES.get(status)
+        if status_enum is None:
+            logger.warning("Invalid status filter: %s", status)
+            raise HTTPException(status_code=400, detail=_STATUS_ERROR)
+        query = query.where(Leave.status == status_enum)
+
+    leaves, next_cursor = await run_in_threadpool(
+        _page_leaves, session, query, offset, limit, after
+    )
+    logger.info("Retrieved %s leave(s) for employee %s", len(leaves), employee_id)
+    return _leaves_response(leaves, next_cursor)
 
 
 @router.put("/{leave_id}", response_model=LeavePublic)
@@ -230,27 +379,9 @@ async def update_leave_status(
         HTTPException: 404 if leave not found, 400 for invalid transitions
     """
     logger.info(
-        f"Attempting to update leave {leave_id} status to {status_update.status}"
+        "Attempting to update leave %s status to %s", leave_id, status_update.status
     )
 
-    leave = session.get(Leave, leave_id)
-    if not leave:
-        logger.warning(f"Leave with ID {leave_id} not found for update")
-        raise HTTPException(status_code=404, detail="Leave not found")
-
-    # Validate status transition
-    if (
-        leave.status != LeaveStatus.PENDING
-        and status_update.status != LeaveStatus.CANCELLED
-    ):
-        logger.warning(
-            f"Invalid status transition from {leave.status} to {status_update.status}"
-        )
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot change status from {leave.status.value} to {status_update.status.value}",
-        )
-
     # Validate required fields for approval
     if status_update.status == LeaveStatus.APPROVED and not status_update.approved_by:
         logger.warning("Approval requires approved_by field")
@@ -269,16 +400,36 @@ async def update_leave_status(
             detail="rejection_reason is required when rejecting a leave",
         )
 
-    # Update leave
-    leave.status = status_update.status
-    leave.approved_by = status_update.approved_by
-    leave.rejection_reason = status_update.rejection_reason
-    leave.updated_at = datetime.now(timezone.utc)
+    # Update leave; only pending leaves may move to anything but CANCELLED
+    allowed_from = (
+        None
+        if status_update.status == LeaveStatus.CANCELLED
+        else (LeaveStatus.PENDING,)
+    )
+    updated = await run_in_threadpool(
+        _change_leave_status,
+        session,
+        leave_id,
+        allowed_from,
+        status=status_update.status,
+        approved_by=status_update.approved_by,
+        rejection_reason=status_update.rejection_reason,
+    )
+    if not updated:
+        current = await run_in_threadpool(_get_leave_status, session, leave_id)
+        if current is None:
+            logger.warning("Leave with ID %s not found for update", leave_id)
+            raise HTTPException(status_code=404, detail="Leave not found")
+        logger.warning(
+            "Invalid status transition from %s to %s", current, status_update.status
+        )
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot change status from {current.value} to {status_update.status.value}",
+        )
 
-    session.add(leave)
-    session.commit()
-    session.refresh(leave)
-    logger.info(f"Leave {leave_id} status updated to {status_update.status.value}")
+    leave = await run_in_threadpool(session.get, Leave, leave_id)
+    logger.info("Leave %s status updated to %s", leave_id, status_update.status.value)
     
     # Publish leave status event (async, non-blocking)
     event_type_str = "approved" if status_update.status == LeaveStatus.APPROVED else \
@@ -327,28 +478,30 @@ async def cancel_leave(
     Raises:
         HTTPException: 404 if leave not found, 400 if leave cannot be cancelled
     """
-    logger.info(f"Attempting to cancel leave with ID: {leave_id}")
-
-    leave = session.get(Leave, leave_id)
-    if not leave:
-        logger.warning(f"Leave with ID {leave_id} not found for cancellation")
-        raise HTTPException(status_code=404, detail="Leave not found")
+    logger.info("Attempting to cancel leave with ID: %s", leave_id)
 
     # Only allow cancellation of pending or approved leaves
-    if leave.status not in [LeaveStatus.PENDING, LeaveStatus.APPROVED]:
-        logger.warning(
-            f"Cannot cancel leave {leave_id} with status {leave.status.value}"
-        )
+    cancelled = await run_in_threadpool(
+        _change_leave_status,
+        session,
+        leave_id,
+        (LeaveStatus.PENDING, LeaveStatus.APPROVED),
+        status=LeaveStatus.CANCELLED,
+    )
+    if not cancelled:
+        current = await run_in_threadpool(_get_leave_status, session, leave_id)
+        if current is None:
+            logger.warning("Leave with ID %s not found for cancellation", leave_id)
+            raise HTTPException(status_code=404, detail="Leave not found")
+        logger.warning("Cannot cancel leave %s with status %s", leave_id, current.value)
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot cancel leave with status {leave.status.value}",
+            detail=f"Cannot cancel leave with status {current.value}",
         )
 
-    leave.status = LeaveStatus.CANCELLED
-    leave.updated_at = datetime.now(timezone.utc)
-    session.add(leave)
-    session.commit()
-    logger.info(f"Leave with ID {leave_id} cancelled successfully")
+    # Load the cancelled leave for the event payload
+    leave = await run_in_threadpool(session.get, Leave, leave_id)
+    logger.info("Leave with ID %s cancelled successfully", leave_id)
     
     # Publish leave cancelled event (async, non-blocking)
     background_tasks.add_task(
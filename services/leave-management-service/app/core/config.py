@@ -3,6 +3,7 @@ Leave Management Service - Application configuration module.
 Centralized settings for database, CORS, and application metadata.
 """
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -17,12 +18,17 @@ class Settings(BaseSettings):
     APP_NAME: str = "Leave Management Service"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
+    LOG_LEVEL: str = "INFO"  # Use WARNING in production to skip INFO formatting
 
     # Kafka Settings (Optional - for async event publishing)
     KAFKA_ENABLE_PRODUCER: bool = True  # Feature flag for Kafka producer
     KAFKA_BOOTSTRAP_SERVERS: str = "kafka:9092"
     KAFKA_LEAVE_TOPIC: str = "leave-queue"
     KAFKA_CLIENT_ID: str = "leave-management-service"
+    KAFKA_ACKS: str = "1"
+    KAFKA_COMPRESSION_TYPE: str = "lz4"
+    KAFKA_LINGER_MS: int = 50  # Wait to fill batches before sending
+    KAFKA_BATCH_SIZE: int = 131072  # 128KB per-partition batches
 
 
     # Database Settings
@@ -31,7 +37,10 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "root"
     DB_HOST: str = "localhost"
     DB_PORT: int = 3306
-    DB_CHARSET: str = "utf8"
+    DB_CHARSET: str = "utf8mb4"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800  # Seconds; keep below MySQL wait_timeout
 
     # CORS Settings
     CORS_ORIGINS: str = "https://localhost,http://localhost:3000"
@@ -39,23 +48,47 @@ class Settings(BaseSettings):
     CORS_ALLOW_METHODS: List[str] = ["*"]
     CORS_ALLOW_HEADERS: List[str] = ["*"]
 
+    # JWT/JWKS Settings
+    JWKS_URL: str = "https://api.asgardeo.io/t/pookieland/oauth2/jwks"
+    JWT_AUDIENCE: str | None = (
+        None  # Set to None to skip audience validation, or set to your client_id
+    )
+    JWT_ISSUER: str | None = (
+        None  # Set to None to skip issuer validation, or set to expected issuer
+    )
+    JWT_EMPLOYEE_ID_CLAIM: str = "employee_id"  # Claim holding the caller's employee ID
+
     # Employee Service Integration Settings
     EMPLOYEE_SERVICE_URL: str | None = None
     EMPLOYEE_SERVICE_TIMEOUT: int = 5
+    EMPLOYEE_CACHE_TTL_SECONDS: int = 300  # How long a found employee is trusted
+    EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS: int = 30  # How long a miss is remembered
+    EMPLOYEE_CACHE_MAX_SIZE: int = 10000
+    EMPLOYEE_VERIFY_BATCH_LINGER_MS: int = 5  # Wait to coalesce lookups
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS_ORIGINS from comma-separated string."""
         if isinstance(self.CORS_ORIGINS, str):
             return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
         return [self.CORS_ORIGINS]
 
-    @property
+    @cached_property
+    def kafka_producer_options(self) -> dict:
+        """Producer tuning passed to shared.kafka.get_producer."""
+        return {
+            "acks": self.KAFKA_ACKS,
+            "compression_type": self.KAFKA_COMPRESSION_TYPE,
+            "linger_ms": self.KAFKA_LINGER_MS,
+            "max_batch_size": self.KAFKA_BATCH_SIZE,
+        }
+
+    @cached_property
     def database_url(self) -> str:
         """Generate MySQL database URL."""
         return f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset={self.DB_CHARSET}"
 
-    @property
+    @cached_property
     def database_url_without_db(self) -> str:
         """Generate MySQL URL without database name (for initial connection)."""
         return f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}?charset={self.DB_CHARSET}"
@@ -46,8 +46,10 @@ def create_db_and_tables() -> None:
 engine = create_engine(
     settings.database_url,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    pool_size=settings.DB_POOL_SIZE,  # Connections kept open in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections under burst load
     pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before MySQL drops them
 )
 
 
@@ -6,6 +6,8 @@ Provides consistent logging setup across the application.
 import logging
 import sys
 
+from app.core.config import settings
+
 
 def setup_logger(name: str) -> logging.Logger:
     """
@@ -18,7 +20,7 @@ def setup_logger(name: str) -> logging.Logger:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(settings.LOG_LEVEL)
 
     # Add handler only if not already present to avoid duplicates
     if not logger.handlers:
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import jwt
 from jwt import PyJWKClient
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 
@@ -19,6 +20,8 @@ logger = get_logger(__name__)
 
 # HTTP Bearer scheme for JWT tokens
 security = HTTPBearer()
+# Same scheme for routes where the token is optional
+optional_security = HTTPBearer(auto_error=False)
 
 # JWKS client for fetching and caching public keys
 jwks_client = PyJWKClient(
@@ -222,6 +225,51 @@ async def get_current_user(
     return decode_token(token)
 
 
+async def get_optional_user(
+    credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(optional_security)
+    ],
+) -> TokenData | None:
+    """
+    Dependency to get the caller from a JWT token if one was sent.
+
+    The token is optional, so a missing, expired or otherwise invalid token
+    yields None and the route treats the caller as anonymous. Decoding may
+    fetch the JWKS over HTTP, so it runs in the threadpool rather than on
+    the event loop; signing keys are cached by jwks_client.
+
+    Args:
+        credentials: HTTP Authorization credentials (Bearer token), if any
+
+    Returns:
+        TokenData with user information, or None without a valid token
+    """
+    if credentials is None:
+        return None
+    try:
+        return await run_in_threadpool(decode_token, credentials.credentials)
+    except HTTPException:
+        logger.info("Ignoring invalid optional bearer token")
+        return None
+
+
+def token_employee_id(user: TokenData) -> int | None:
+    """
+    Return the employee ID carried in a validated token, if any.
+
+    Args:
+        user: Decoded token data
+
+    Returns:
+        The JWT_EMPLOYEE_ID_CLAIM claim as an int, or None if absent or invalid
+    """
+    value = user.raw_claims.get(settings.JWT_EMPLOYEE_ID_CLAIM)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 async def get_current_active_user(
     current_user: Annotated[TokenData, Depends(get_current_user)],
 ) -> TokenData:
@@ -355,3 +403,4 @@ def require_all_roles(*required_roles: str):
 # Type aliases for common dependencies
 CurrentUser = Annotated[TokenData, Depends(get_current_user)]
 CurrentActiveUser = Annotated[TokenData, Depends(get_current_active_user)]
+OptionalUser = Annotated[TokenData | None, Depends(get_optional_user)]
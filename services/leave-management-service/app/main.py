@@ -11,6 +11,7 @@ from app.core.config import settings
 from app.core.database import create_db_and_tables
 from app.core.logging import get_logger
 from app.api.routes.leaves import router as leaves_router
+from app.services.employee_service import close_http_client, get_http_client
 
 logger = get_logger(__name__)
 
@@ -39,7 +40,8 @@ async def lifespan(_: FastAPI):
             logger.info("Initializing Kafka producer...")
             await get_producer(
                 bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-                client_id=settings.KAFKA_CLIENT_ID
+                client_id=settings.KAFKA_CLIENT_ID,
+                **settings.kafka_producer_options,
             )
             logger.info(f"✅ Kafka producer started (topic: {settings.KAFKA_LEAVE_TOPIC})")
         except Exception as e:
@@ -48,6 +50,9 @@ async def lifespan(_: FastAPI):
     else:
         logger.info("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False)")
     
+    # Open the pooled Employee Service client
+    get_http_client()
+
     logger.info("Leave Management Service startup complete")
 
     yield
@@ -55,6 +60,8 @@ async def lifespan(_: FastAPI):
     # Shutdown
     logger.info("Leave Management Service shutting down...")
     
+    await close_http_client()
+    
     # Stop Kafka producer
     if settings.KAFKA_ENABLE_PRODUCER:
         try:
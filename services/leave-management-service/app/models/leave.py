@@ -3,6 +3,7 @@ Leave database model.
 Defines the SQLModel table structure for the Leave entity.
 """
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 from enum import Enum
@@ -32,8 +33,17 @@ class Leave(SQLModel, table=True):
     """
     Leave database table model.
     Represents the leave table in the database with all required fields.
+
+    The list endpoints filter by employee and/or status and page in id order.
+    InnoDB appends the primary key to every secondary index, so these
+    indexes also return matching rows already sorted by id.
     """
 
+    __table_args__ = (
+        Index("ix_leave_employee_status", "employee_id", "status"),
+        Index("ix_leave_status", "status"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     employee_id: int = Field(index=True, nullable=False)
     leave_type: LeaveType = Field(default=LeaveType.CASUAL, nullable=False)
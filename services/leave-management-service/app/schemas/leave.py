@@ -4,12 +4,20 @@ Defines request/response models for Leave API endpoints.
 Separates API contracts from database models for better flexibility.
 """
 
+from pydantic import model_validator
 from sqlmodel import SQLModel, Field
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.models.leave import LeaveType, LeaveStatus
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Return value as an aware UTC datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 class LeaveBase(SQLModel):
     """
     Base leave schema with shared fields.
@@ -27,9 +35,18 @@ class LeaveCreate(LeaveBase):
     """
     Schema for creating a new leave request.
     Inherits all required fields from LeaveBase.
+    Dates are normalized to UTC (naive values are taken as UTC) so they
+    always compare cleanly, and start_date must be before end_date.
     """
 
-    pass
+    @model_validator(mode="after")
+    def check_date_range(self) -> "LeaveCreate":
+        """Normalize both dates to UTC and reject empty or inverted ranges."""
+        self.start_date = _as_utc(self.start_date)
+        self.end_date = _as_utc(self.end_date)
+        if self.start_date >= self.end_date:
+            raise ValueError("start_date must be before end_date")
+        return self
 
 
 class LeaveStatusUpdate(SQLModel):
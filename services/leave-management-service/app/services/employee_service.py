@@ -4,17 +4,99 @@ Handles communication with the Employee Service for employee validation.
 Provides methods to verify employee existence.
 """
 
+import asyncio
+import time
+
 from app.core.config import settings
 from app.core.logging import get_logger
 import httpx
 
 logger = get_logger(__name__)
 
-# Cache for employee verification (can be enhanced with TTL)
-_employee_cache = {}
+# Cache for employee verification: employee_id -> (expires_at, exists).
+# Bounded, and entries expire so employees removed upstream are noticed.
+# Negative results expire sooner so newly created employees show up quickly.
+_employee_cache: dict[int, tuple[float, bool]] = {}
+
+# Verifications waiting for the next batched lookup: employee_id -> waiters
+_pending_verifications: dict[int, list[asyncio.Future]] = {}
+_verification_flush_task: asyncio.Task | None = None
+
+# Largest ids= list the Employee Service list endpoint accepts
+_MAX_BATCH_IDS = 100
+
+# Shared HTTP client so calls to the Employee Service reuse pooled keep-alive
+# connections instead of opening a new one per request
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared Employee Service HTTP client.
+
+    Returns:
+        AsyncClient configured with the Employee Service base URL and timeout
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=settings.EMPLOYEE_SERVICE_URL or "",
+            timeout=settings.EMPLOYEE_SERVICE_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Employee Service HTTP client. Called at shutdown."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _get_cached_result(employee_id: int) -> bool | None:
+    """Return the cached verification result if it has not expired."""
+    entry = _employee_cache.get(employee_id)
+    if entry is None:
+        return None
+
+    expires_at, exists = entry
+    if expires_at <= time.monotonic():
+        _employee_cache.pop(employee_id, None)
+        return None
+    return exists
+
 
+def _cache_result(employee_id: int, exists: bool) -> None:
+    """
+    Cache a verification result with the positive or negative TTL.
 
-def verify_employee_exists(employee_id: int) -> bool:
+    When the cache is full, expired entries are purged first and the oldest
+    entry is evicted if that does not free a slot.
+    """
+    now = time.monotonic()
+    ttl = (
+        settings.EMPLOYEE_CACHE_TTL_SECONDS
+        if exists
+        else settings.EMPLOYEE_CACHE_NEGATIVE_TTL_SECONDS
+    )
+
+    if (
+        employee_id not in _employee_cache
+        and len(_employee_cache) >= settings.EMPLOYEE_CACHE_MAX_SIZE
+    ):
+        expired = [k for k, (exp, _) in _employee_cache.items() if exp <= now]
+        for k in expired:
+            del _employee_cache[k]
+        if len(_employee_cache) >= settings.EMPLOYEE_CACHE_MAX_SIZE:
+            _employee_cache.pop(next(iter(_employee_cache)))
+    _employee_cache[employee_id] = (now + ttl, exists)
+
+
+async def verify_employee_exists(employee_id: int) -> bool:
     """
     Verify that an employee exists via Employee Service.
 
@@ -30,28 +112,30 @@ def verify_employee_exists(employee_id: int) -> bool:
         True if employee exists, False otherwise
     """
     # Check cache first
-    if employee_id in _employee_cache:
-        logger.debug(f"Employee {employee_id} found in cache")
-        return _employee_cache[employee_id]
+    cached = _get_cached_result(employee_id)
+    if cached is not None:
+        logger.debug("Employee %s found in cache", employee_id)
+        return cached
 
     # Call Employee Service API
     try:
         if not settings.EMPLOYEE_SERVICE_URL:
             logger.warning(
-                f"EMPLOYEE_SERVICE_URL not configured, cannot verify employee {employee_id}"
+                "EMPLOYEE_SERVICE_URL not configured, cannot verify employee %s",
+                employee_id,
             )
             return False
 
-        result = _verify_via_employee_service(employee_id)
-        _employee_cache[employee_id] = result
+        result = await _verify_via_employee_service(employee_id)
+        _cache_result(employee_id, result)
         return result
 
     except Exception as e:
-        logger.error(f"Failed to verify employee {employee_id}: {e}")
+        logger.error("Failed to verify employee %s: %s", employee_id, e)
         return False
 
 
-def _verify_via_employee_service(employee_id: int) -> bool:
+async def _verify_via_employee_service(employee_id: int) -> bool:
     """
     Verify employee existence by calling the Employee Service API.
 
@@ -62,37 +146,181 @@ def _verify_via_employee_service(employee_id: int) -> bool:
         True if employee exists, False otherwise
     """
     try:
-        employee_service_url = settings.EMPLOYEE_SERVICE_URL
-        url = f"{employee_service_url}/api/v1/employees/{employee_id}"
-
-        with httpx.Client(timeout=settings.EMPLOYEE_SERVICE_TIMEOUT) as client:
-            response = client.get(url)
-
-            if response.status_code == 200:
-                logger.info(f"Employee {employee_id} verified via Employee Service")
-                return True
-            elif response.status_code == 404:
-                logger.info(f"Employee {employee_id} not found in Employee Service")
-                return False
-            else:
-                logger.warning(
-                    f"Employee Service returned status {response.status_code} "
-                    f"for employee {employee_id}"
-                )
-                return False
+        response = await get_http_client().get(f"/api/v1/employees/{employee_id}")
+
+        if response.status_code == 200:
+            logger.info("Employee %s verified via Employee Service", employee_id)
+            return True
+        elif response.status_code == 404:
+            logger.info("Employee %s not found in Employee Service", employee_id)
+            return False
+        else:
+            logger.warning(
+                "Employee Service returned status %s for employee %s",
+                response.status_code,
+                employee_id,
+            )
+            return False
 
     except httpx.ConnectError as e:
-        logger.error(f"Failed to connect to Employee Service: {e}")
+        logger.error("Failed to connect to Employee Service: %s", e)
         return False
     except httpx.TimeoutException as e:
-        logger.error(f"Employee Service request timed out: {e}")
+        logger.error("Employee Service request timed out: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Error calling Employee Service: {e}")
+        logger.error("Error calling Employee Service: %s", e)
+        return False
+
+
+async def verify_employee_exists_batched(employee_id: int) -> bool:
+    """
+    Verify that an employee exists, coalescing concurrent lookups.
+
+    Cache misses are queued for EMPLOYEE_VERIFY_BATCH_LINGER_MS, then every
+    queued ID is checked with a single Employee Service request instead of
+    one request per leave operation.
+
+    Args:
+        employee_id: The ID of the employee to verify
+
+    Returns:
+        True if employee exists, False otherwise
+    """
+    global _verification_flush_task
+
+    cached = _get_cached_result(employee_id)
+    if cached is not None:
+        logger.debug("Employee %s found in cache", employee_id)
+        return cached
+
+    if not settings.EMPLOYEE_SERVICE_URL:
+        logger.warning(
+            "EMPLOYEE_SERVICE_URL not configured, cannot verify employee %s",
+            employee_id,
+        )
         return False
 
+    future = asyncio.get_running_loop().create_future()
+    _pending_verifications.setdefault(employee_id, []).append(future)
+    if _verification_flush_task is None or _verification_flush_task.done():
+        _verification_flush_task = asyncio.create_task(_flush_pending_verifications())
+    # Safety net only: the waiter may sit out a lookup already in flight, then
+    # its own, and each lookup is a batch request plus the single-GET fallback
+    timeout = (
+        4 * settings.EMPLOYEE_SERVICE_TIMEOUT
+        + settings.EMPLOYEE_VERIFY_BATCH_LINGER_MS / 1000
+    )
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        logger.error("Timed out verifying employee %s", employee_id)
+        return False
+
+
+async def _flush_pending_verifications() -> None:
+    """
+    Resolve queued verifications with batched Employee Service lookups.
+
+    Keeps flushing until nothing is queued, so verifications queued while a
+    lookup is in flight are handled by the same task. If the task is
+    cancelled or a lookup raises, every waiter it has not resolved gets
+    False, like an unreachable Employee Service, instead of hanging.
+    """
+    global _pending_verifications
+
+    pending: dict[int, list[asyncio.Future]] = {}
+    try:
+        while True:
+            await asyncio.sleep(settings.EMPLOYEE_VERIFY_BATCH_LINGER_MS / 1000)
+            pending, _pending_verifications = _pending_verifications, {}
+            if not pending:
+                return
+            await _resolve_verifications(pending)
+    finally:
+        stranded = [*pending.values(), *_pending_verifications.values()]
+        _pending_verifications = {}
+        for waiters in stranded:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(False)
+
+
+async def _resolve_verifications(pending: dict[int, list[asyncio.Future]]) -> None:
+    """
+    Look up a set of queued verifications and resolve their waiters.
+
+    Args:
+        pending: Employee ID -> futures waiting for its verification
+    """
+    employee_ids = list(pending)
+    chunks = [
+        employee_ids[start : start + _MAX_BATCH_IDS]
+        for start in range(0, len(employee_ids), _MAX_BATCH_IDS)
+    ]
+    found: set[int] = set()
+    for chunk_found in await asyncio.gather(
+        *(_verify_many_via_employee_service(chunk) for chunk in chunks)
+    ):
+        found.update(chunk_found)
+
+    for employee_id, waiters in pending.items():
+        exists = employee_id in found
+        _cache_result(employee_id, exists)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(exists)
+
+
+async def _verify_many_via_employee_service(employee_ids: list[int]) -> set[int]:
+    """
+    Look up several employees with one Employee Service list request.
+
+    Falls back to one request per employee if the batch request fails, or
+    if the response holds employees that were not asked for: an Employee
+    Service without ids= support returns its first page instead, and that
+    must not mark every other requested employee as missing.
+
+    Args:
+        employee_ids: IDs to verify (at most _MAX_BATCH_IDS)
+
+    Returns:
+        The subset of employee_ids that exist
+    """
+    try:
+        response = await get_http_client().get(
+            "/api/v1/employees/",
+            params={"ids": employee_ids, "limit": len(employee_ids)},
+        )
+        if response.status_code == 200:
+            found = {employee["id"] for employee in response.json()}
+            if found.issubset(employee_ids):
+                logger.info(
+                    "Verified %s employee(s) via Employee Service, %s found",
+                    len(employee_ids),
+                    len(found),
+                )
+                return found
+            logger.warning(
+                "Employee Service ignored the ids filter, "
+                "falling back to single lookups"
+            )
+        else:
+            logger.warning(
+                "Employee Service batch lookup returned status %s, "
+                "falling back to single lookups",
+                response.status_code,
+            )
+    except Exception as e:
+        logger.warning("Employee Service batch lookup failed: %s", e)
+
+    results = await asyncio.gather(
+        *(_verify_via_employee_service(employee_id) for employee_id in employee_ids)
+    )
+    return {eid for eid, exists in zip(employee_ids, results) if exists}
 
-def get_employee_name(employee_id: int) -> str | None:
+
+async def get_employee_name(employee_id: int) -> str | None:
     """
     Retrieve the name of an employee by ID from Employee Service.
 
@@ -106,18 +334,18 @@ def get_employee_name(employee_id: int) -> str | None:
     """
     try:
         if not settings.EMPLOYEE_SERVICE_URL:
-            logger.debug(f"EMPLOYEE_SERVICE_URL not configured")
+            logger.debug("EMPLOYEE_SERVICE_URL not configured")
             return None
 
-        name = _get_employee_name_from_service(employee_id)
+        name = await _get_employee_name_from_service(employee_id)
         return name
 
     except Exception as e:
-        logger.warning(f"Failed to get employee name: {e}")
+        logger.warning("Failed to get employee name: %s", e)
         return None
 
 
-def _get_employee_name_from_service(employee_id: int) -> str | None:
+async def _get_employee_name_from_service(employee_id: int) -> str | None:
     """
     Get employee name from Employee Service API.
 
@@ -128,19 +356,15 @@ def _get_employee_name_from_service(employee_id: int) -> str | None:
         Employee name if found, None otherwise
     """
     try:
-        employee_service_url = settings.EMPLOYEE_SERVICE_URL
-        url = f"{employee_service_url}/api/v1/employees/{employee_id}"
-
-        with httpx.Client(timeout=settings.EMPLOYEE_SERVICE_TIMEOUT) as client:
-            response = client.get(url)
+        response = await get_http_client().get(f"/api/v1/employees/{employee_id}")
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("name")
-            return None
+        if response.status_code == 200:
+            data = response.json()
+            return data.get("name")
+        return None
 
     except Exception as e:
-        logger.debug(f"Failed to get employee name from service: {e}")
+        logger.debug("Failed to get employee name from service: %s", e)
         return None
 
 
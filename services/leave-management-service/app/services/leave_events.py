@@ -3,6 +3,10 @@ Leave event publishing utilities.
 Handles async Kafka event publishing for leave lifecycle events.
 """
 
+import asyncio
+import sys
+from functools import partial
+from pathlib import Path
 from typing import Optional
 from datetime import date
 from app.core.logging import get_logger
@@ -10,6 +14,48 @@ from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# Directory holding the shared package (the same one main.py adds at startup);
+# imported here once so publish_leave_event doesn't redo it per event
+_SHARED_PATH = str(Path(__file__).resolve().parents[3])
+if _SHARED_PATH not in sys.path:
+    sys.path.insert(0, _SHARED_PATH)
+
+try:
+    from shared.kafka import EventType, create_leave_event, get_producer
+
+    _KAFKA_AVAILABLE = True
+    _EVENT_TYPE_MAP = {
+        "created": EventType.LEAVE_REQUESTED,
+        "approved": EventType.LEAVE_APPROVED,
+        "rejected": EventType.LEAVE_REJECTED,
+        "cancelled": EventType.LEAVE_CANCELLED,
+    }
+except ImportError as e:
+    logger.warning("Kafka support unavailable, leave events disabled: %s", e)
+    _KAFKA_AVAILABLE = False
+    _EVENT_TYPE_MAP = {}
+
+
+def _log_send_result(
+    event_type_str: str, leave_id: int, future: asyncio.Future
+) -> None:
+    """Log the broker's delivery result for a published leave event."""
+    if future.cancelled():
+        logger.warning(
+            "Leave event send cancelled: %s for leave %s", event_type_str, leave_id
+        )
+    elif future.exception() is not None:
+        logger.warning(
+            "Failed to send leave event via Kafka: %s for leave %s: %s",
+            event_type_str,
+            leave_id,
+            future.exception(),
+        )
+    else:
+        logger.info(
+            "Leave event sent via Kafka: %s for leave %s", event_type_str, leave_id
+        )
+
 
 async def publish_leave_event(
     event_type_str: str,
@@ -22,12 +68,15 @@ async def publish_leave_event(
     reason: Optional[str] = None,
     approved_by: Optional[int] = None,
     rejection_reason: Optional[str] = None,
+    employee_email: Optional[str] = None,
 ) -> bool:
     """
     Publish leave lifecycle event to Kafka.
     
     Tries Kafka first if enabled, logs appropriately if disabled or fails.
-    This is a fire-and-forget operation that doesn't block the main request.
+    This is a fire-and-forget operation that doesn't block the main request:
+    the event is handed to the producer's batcher and the broker
+    acknowledgment is logged from a callback instead of being awaited.
     
     Args:
         event_type_str: Event type string ('created', 'approved', 'rejected', 'cancelled')
@@ -40,37 +89,27 @@ async def publish_leave_event(
         reason: Leave reason (optional)
         approved_by: Approver user ID (optional)
         rejection_reason: Rejection reason (optional)
+        employee_email: Employee's email, when the caller knows it (optional)
     
     Returns:
-        True if published successfully, False otherwise
+        True if the event was handed to the producer, False otherwise
     """
     if not settings.KAFKA_ENABLE_PRODUCER:
         logger.debug("Kafka producer disabled (KAFKA_ENABLE_PRODUCER=False), skipping leave event")
         return False
+    if not _KAFKA_AVAILABLE:
+        return False
     
     try:
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-        
-        from shared.kafka import get_producer, create_leave_event, EventType
-        
-        # Map string to EventType
-        event_type_map = {
-            "created": EventType.LEAVE_REQUESTED,
-            "approved": EventType.LEAVE_APPROVED,
-            "rejected": EventType.LEAVE_REJECTED,
-            "cancelled": EventType.LEAVE_CANCELLED,
-        }
-        
-        event_type = event_type_map.get(event_type_str)
+        event_type = _EVENT_TYPE_MAP.get(event_type_str)
         if not event_type:
-            logger.warning(f"Unknown leave event type: {event_type_str}")
+            logger.warning("Unknown leave event type: %s", event_type_str)
             return False
         
         producer = await get_producer(
             bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-            client_id=settings.KAFKA_CLIENT_ID
+            client_id=settings.KAFKA_CLIENT_ID,
+            **settings.kafka_producer_options,
         )
         
         if not producer or not producer.is_started:
@@ -89,7 +128,7 @@ async def publish_leave_event(
             event_type=event_type,
             leave_id=leave_id,
             employee_id=employee_id,
-            employee_email=f"employee{employee_id}@company.com",  # Placeholder
+            employee_email=employee_email,
             leave_type=leave_type,
             start_date=start_date_str,
             end_date=end_date_str,
@@ -100,14 +139,10 @@ async def publish_leave_event(
             rejection_reason=rejection_reason,
         )
         
-        success = await producer.send_event(settings.KAFKA_LEAVE_TOPIC, event)
-        if success:
-            logger.info(f"Leave event sent via Kafka: {event_type_str} for leave {leave_id}")
-            return True
-        else:
-            logger.warning(f"Failed to send leave event via Kafka: {event_type_str} for leave {leave_id}")
-            return False
+        future = await producer.send_event_nowait(settings.KAFKA_LEAVE_TOPIC, event)
+        future.add_done_callback(partial(_log_send_result, event_type_str, leave_id))
+        return True
             
     except Exception as e:
-        logger.error(f"Error publishing leave event: {e}")
+        logger.error("Error publishing leave event: %s", e)
         return False
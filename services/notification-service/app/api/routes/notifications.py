@@ -3,9 +3,14 @@ Notification API routes.
 Handles all operations for notification resources including sending and retrieving notifications.
 """
 
+import asyncio
+import random
 from typing import Annotated
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import raiseload
 from sqlmodel import select, func, Session  # type: ignore
 
 from app.api.deps import SessionDep
@@ -17,12 +22,44 @@ from app.models.notification import (
     NotificationListResponse,
     NotificationStatus,
 )
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.database import get_session
+from app.core.database import engine
 from app.services.email import send_notification_email
 
 logger = get_logger(__name__)
 
+_UTC = timezone.utc
+
+# OS-seeded so replicas don't draw the same retry delays
+_jitter = random.SystemRandom()
+
+# Constant parts of the list queries, built once; each request only adds its
+# filters and paging. SQLAlchemy caches the compiled SQL per statement shape.
+# raiseload turns any relationship added later into an error instead of a
+# silent per-row query while a page is serialized.
+_PAGE_QUERY = (
+    select(Notification, func.count().over().label("total"))
+    .options(raiseload("*"))
+    .order_by(Notification.id)
+)
+_COUNT_QUERY = select(func.count(Notification.id))
+
+# Retries waiting to be sent, most overdue first; SKIP LOCKED lets several
+# replicas poll at once without picking the same rows
+_DUE_RETRY_QUERY = (
+    select(Notification)
+    .where(Notification.status == NotificationStatus.RETRYING)
+    .order_by(Notification.next_retry_at)
+    .with_for_update(skip_locked=True)
+)
+
+# Columns exposed by the API, for dumping rows without a model round-trip
+_PUBLIC_FIELDS = frozenset(NotificationPublic.model_fields)
+
+# Accepted values for the list endpoint's status filter
+_VALID_STATUSES = frozenset(s.value for s in NotificationStatus)
+
 # Create router with prefix and tags for better organization
 router = APIRouter(
     prefix="/notifications",
@@ -31,6 +68,144 @@ router = APIRouter(
 )
 
 
+def _page_notifications(
+    session: Session, filters: list, offset: int, limit: int
+) -> tuple[int, list[Notification]]:
+    """
+    Fetch one page of notifications together with the total match count.
+
+    The total rides along on every row as COUNT(*) OVER(), so a page costs a
+    single query. Only a page past the end (no rows to carry the total)
+    falls back to a separate COUNT.
+
+    Args:
+        session: Database session
+        filters: WHERE clauses to apply
+        offset: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Total number of matching notifications and the requested page
+    """
+    rows = session.exec(
+        _PAGE_QUERY.where(*filters).offset(offset).limit(limit)
+    ).all()
+    if rows:
+        return rows[0][1], [notification for notification, _total in rows]
+    if offset == 0:
+        return 0, []
+    total = session.exec(_COUNT_QUERY.where(*filters)).one()
+    return total, []
+
+
+def _list_response(
+    total: int, offset: int, limit: int, notifications: list[Notification]
+) -> ORJSONResponse:
+    """
+    Serialize a page of notifications straight to JSON.
+
+    The rows come from the database and already match NotificationPublic,
+    so they are dumped to its fields directly instead of being re-validated
+    through NotificationListResponse.
+
+    Args:
+        total: Total number of matching notifications
+        offset: Number of records skipped
+        limit: Maximum number of records requested
+        notifications: One page of notifications
+
+    Returns:
+        JSON response in the NotificationListResponse shape
+    """
+    return ORJSONResponse(
+        {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "items": [
+                notification.model_dump(include=_PUBLIC_FIELDS)
+                for notification in notifications
+            ],
+        }
+    )
+
+
+def _retry_delay(retry_count: int) -> timedelta:
+    """
+    Full-jitter exponential backoff for the next email retry.
+
+    The delay is drawn uniformly from zero up to the exponential bound, so
+    notifications that failed together (e.g. during an SMTP outage) do not
+    all retry at the same moment.
+
+    Args:
+        retry_count: Number of failed attempts so far
+
+    Returns:
+        Time to wait before the next attempt
+    """
+    bound = min(
+        settings.RETRY_DELAY_SECONDS,
+        settings.RETRY_BASE_DELAY_SECONDS * 2**retry_count,
+    )
+    return timedelta(seconds=_jitter.uniform(0, bound))
+
+
+def _record_email_result(
+    notification_id: int, success: bool, error: str | None = None
+) -> None:
+    """
+    Update a notification's status after a send attempt.
+
+    Opens its own pooled session since it runs after the request's session
+    is gone. This blocks on the database, so it is called through
+    run_in_threadpool.
+
+    Args:
+        notification_id: ID of the notification
+        success: Whether the email was sent
+        error: Error message if the send attempt raised
+    """
+    with Session(engine) as session:
+        notification = session.get(Notification, notification_id)
+        if not notification:
+            return
+
+        now = datetime.now(_UTC)
+
+        if error is not None:
+            notification.status = NotificationStatus.FAILED
+            notification.error_message = error
+            notification.retry_count += 1
+            notification.next_retry_at = None
+        elif success:
+            notification.status = NotificationStatus.SENT
+            notification.sent_at = now
+            notification.next_retry_at = None
+            logger.info(f"Notification {notification_id} sent successfully")
+        else:
+            notification.retry_count += 1
+            if notification.retry_count >= settings.MAX_RETRIES:
+                notification.status = NotificationStatus.FAILED
+                notification.error_message = "Max retries exceeded"
+                notification.next_retry_at = None
+                logger.error(
+                    f"Notification {notification_id} failed after max retries"
+                )
+            else:
+                notification.status = NotificationStatus.RETRYING
+                notification.error_message = "Email send failed, will retry"
+                notification.next_retry_at = now + _retry_delay(
+                    notification.retry_count
+                )
+                logger.warning(
+                    f"Notification {notification_id} will be retried (attempt {notification.retry_count})"
+                )
+        notification.updated_at = now
+        session.add(notification)
+        session.commit()
+
+
 async def send_email_background(
     notification_id: int,
     recipient_email: str,
@@ -48,9 +223,7 @@ async def send_email_background(
         subject: Email subject
         body: Email body
     """
-    session_gen = get_session()
-    session = next(session_gen)
-
+    success, error = False, None
     try:
         success = await send_notification_email(
             to_email=recipient_email,
@@ -58,51 +231,85 @@ async def send_email_background(
             subject=subject,
             body=body,
         )
-
-        notification = session.get(Notification, notification_id)
-        if notification:
-            if success:
-                notification.status = NotificationStatus.SENT
-                notification.sent_at = datetime.utcnow()
-                logger.info(f"Notification {notification_id} sent successfully")
-            else:
-                notification.retry_count += 1
-                if notification.retry_count >= 3:
-                    notification.status = NotificationStatus.FAILED
-                    notification.error_message = "Max retries exceeded"
-                    logger.error(
-                        f"Notification {notification_id} failed after max retries"
-                    )
-                else:
-                    notification.status = NotificationStatus.RETRYING
-                    notification.error_message = "Email send failed, will retry"
-                    logger.warning(
-                        f"Notification {notification_id} will be retried (attempt {notification.retry_count})"
-                    )
-            notification.updated_at = datetime.utcnow()
-            session.add(notification)
-            session.commit()
     except Exception as e:
         logger.error(
             f"Error in background email task for notification {notification_id}: {str(e)}"
         )
+        error = str(e)
+
+    try:
+        await run_in_threadpool(_record_email_result, notification_id, success, error)
+    except Exception as db_error:
+        logger.error(f"Failed to update notification status: {str(db_error)}")
+
+
+def _claim_due_retries(limit: int) -> list[Notification]:
+    """
+    Pick RETRYING notifications whose next_retry_at has passed.
+
+    Each picked row's next_retry_at is pushed out by RETRY_DELAY_SECONDS
+    before it is sent. This acts as a lease: other pollers skip it, and
+    if the process dies mid-send the row becomes due again later instead
+    of being stuck. The send result then sets the real next attempt.
+
+    Args:
+        limit: Maximum number of notifications to pick
+
+    Returns:
+        The picked notifications
+    """
+    with Session(engine, expire_on_commit=False) as session:
+        now = datetime.now(_UTC)
+        notifications = session.exec(
+            _DUE_RETRY_QUERY.where(Notification.next_retry_at <= now).limit(limit)
+        ).all()
+        lease_until = now + timedelta(seconds=settings.RETRY_DELAY_SECONDS)
+        for notification in notifications:
+            notification.next_retry_at = lease_until
+            session.add(notification)
+        session.commit()
+        return list(notifications)
+
+
+async def send_due_retries() -> int:
+    """
+    Send every notification whose retry is due, up to RETRY_BATCH_SIZE.
+
+    Returns:
+        Number of notifications retried
+    """
+    notifications = await run_in_threadpool(
+        _claim_due_retries, settings.RETRY_BATCH_SIZE
+    )
+    await asyncio.gather(
+        *(
+            send_email_background(
+                notification_id=notification.id,
+                recipient_email=notification.recipient_email,
+                recipient_name=notification.recipient_name,
+                subject=notification.subject,
+                body=notification.body,
+            )
+            for notification in notifications
+        )
+    )
+    return len(notifications)
+
+
+async def run_retry_scheduler() -> None:
+    """Retry due notifications every RETRY_POLL_INTERVAL_SECONDS until cancelled."""
+    while True:
         try:
-            notification = session.get(Notification, notification_id)
-            if notification:
-                notification.status = NotificationStatus.FAILED
-                notification.error_message = str(e)
-                notification.retry_count += 1
-                notification.updated_at = datetime.utcnow()
-                session.add(notification)
-                session.commit()
-        except Exception as db_error:
-            logger.error(f"Failed to update notification status: {str(db_error)}")
-    finally:
-        session.close()
+            retried = await send_due_retries()
+            if retried:
+                logger.info(f"Retried {retried} due notification(s)")
+        except Exception as e:
+            logger.error(f"Error retrying due notifications: {e}")
+        await asyncio.sleep(settings.RETRY_POLL_INTERVAL_SECONDS)
 
 
 @router.post("/send", response_model=NotificationPublic, status_code=201, deprecated=True)
-async def send_notification(
+def send_notification(
     notification: NotificationCreate,
     session: SessionDep,
     background_tasks: BackgroundTasks,
@@ -135,11 +342,9 @@ async def send_notification(
     # Create notification in database
     db_notification = Notification.model_validate(notification)
     db_notification.status = NotificationStatus.PENDING
-    db_notification.created_at = datetime.utcnow()
-    db_notification.updated_at = datetime.utcnow()
+    db_notification.created_at = db_notification.updated_at = datetime.now(_UTC)
     session.add(db_notification)
     session.commit()
-    session.refresh(db_notification)
 
     logger.info(f"Notification {db_notification.id} created successfully")
 
@@ -186,7 +391,7 @@ def get_employee_notifications(
     session: SessionDep,
     offset: int = Query(0, ge=0),
     limit: Annotated[int, Query(le=100)] = 100,
-) -> NotificationListResponse:
+) -> ORJSONResponse:
     """
     Retrieve all notifications for a specific employee with pagination.
 
@@ -203,31 +408,15 @@ def get_employee_notifications(
         f"Fetching notifications for employee {employee_id} with offset={offset}, limit={limit}"
     )
 
-    # Get total count
-    total = session.exec(
-        select(func.count(Notification.id)).where(
-            Notification.employee_id == employee_id
-        )
-    ).first()
-
-    # Get paginated results
-    notifications = session.exec(
-        select(Notification)
-        .where(Notification.employee_id == employee_id)
-        .offset(offset)
-        .limit(limit)
-    ).all()
+    total, notifications = _page_notifications(
+        session, [Notification.employee_id == employee_id], offset, limit
+    )
 
     logger.info(
         f"Retrieved {len(notifications)} notification(s) for employee {employee_id}"
     )
 
-    return NotificationListResponse(
-        total=total or 0,
-        offset=offset,
-        limit=limit,
-        items=list(notifications),
-    )
+    return _list_response(total, offset, limit, notifications)
 
 
 @router.get("", response_model=NotificationListResponse)
@@ -236,7 +425,7 @@ def list_notifications(
     offset: int = Query(0, ge=0),
     limit: Annotated[int, Query(le=100)] = 100,
     status: str | None = Query(None),
-) -> NotificationListResponse:
+) -> ORJSONResponse:
     """
     List all notifications with optional filtering and pagination.
 
@@ -253,37 +442,22 @@ def list_notifications(
         f"Fetching notifications with offset={offset}, limit={limit}, status={status}"
     )
 
-    # Build query
-    query = select(Notification)
+    # Build filters
+    filters = []
     if status:
-        try:
-            # Validate status enum
-            NotificationStatus(status)
-            query = query.where(Notification.status == status)
-        except ValueError:
+        if status not in _VALID_STATUSES:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+        filters.append(Notification.status == status)
 
-    # Get total count
-    count_query = select(func.count(Notification.id))
-    if status:
-        count_query = count_query.where(Notification.status == status)
-    total = session.exec(count_query).first()
-
-    # Get paginated results
-    notifications = session.exec(query.offset(offset).limit(limit)).all()
+    total, notifications = _page_notifications(session, filters, offset, limit)
 
     logger.info(f"Retrieved {len(notifications)} notification(s)")
 
-    return NotificationListResponse(
-        total=total or 0,
-        offset=offset,
-        limit=limit,
-        items=list(notifications),
-    )
+    return _list_response(total, offset, limit, notifications)
 
 
 @router.put("/{notification_id}/retry", response_model=NotificationPublic)
-async def retry_notification(
+def retry_notification(
     notification_id: int,
     session: SessionDep,
     background_tasks: BackgroundTasks,
@@ -320,11 +494,13 @@ async def retry_notification(
             detail=f"Cannot retry notification with status {notification.status}",
         )
 
+    now = datetime.now(_UTC)
     notification.status = NotificationStatus.RETRYING
-    notification.updated_at = datetime.utcnow()
+    # Sent right away below; the lease keeps the scheduler from sending it too
+    notification.next_retry_at = now + timedelta(seconds=settings.RETRY_DELAY_SECONDS)
+    notification.updated_at = now
     session.add(notification)
     session.commit()
-    session.refresh(notification)
 
     logger.info(f"Notification {notification_id} marked for retry")
 
@@ -4,19 +4,23 @@ Processes notification events from the notification-queue topic.
 """
 
 import asyncio
+import random
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import shared modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from shared.kafka import KafkaConsumer, EventType
+from shared.kafka import KafkaConsumer, KafkaProducer, EventType
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.services.email_service import send_email
 
 logger = get_logger(__name__)
 
+# Upper bound on the wait before restarting a failed consume loop
+_RESTART_MAX_DELAY_SECONDS = 60
+
 
 class NotificationConsumer:
     """
@@ -27,7 +31,14 @@ class NotificationConsumer:
     def __init__(self):
         """Initialize the notification consumer."""
         self.consumer = None
+        self.dlq_producer = None
         self.running = False
+        self._task = None
+        self._dlq_queue = asyncio.Queue(maxsize=settings.KAFKA_DLQ_QUEUE_MAX_SIZE)
+        self._dlq_task = None
+        self._send_slots = asyncio.Semaphore(settings.KAFKA_EMAIL_CONCURRENCY)
+        # Consecutive failed runs of the consume loop, reset by a handled batch
+        self._restart_attempt = 0
     
     async def start(self):
         """Start the Kafka consumer."""
@@ -39,7 +50,7 @@ class NotificationConsumer:
                 client_id=f"{settings.APP_NAME}-consumer",
                 auto_offset_reset="earliest",
                 enable_auto_commit=False,  # Manual commit for reliability
-                max_poll_records=100,
+                max_poll_records=settings.KAFKA_MAX_POLL_RECORDS,
             )
             
             await self.consumer.start()
@@ -49,9 +60,18 @@ class NotificationConsumer:
                 f"group={settings.KAFKA_CONSUMER_GROUP_ID}"
             )
             
+            # One long-lived producer for dead-lettered events
+            self.dlq_producer = KafkaProducer(
+                bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
+                client_id=f"{settings.APP_NAME}-dlq-producer",
+                **settings.kafka_producer_options,
+            )
+            await self.dlq_producer.start()
+            self._dlq_task = asyncio.create_task(self._dlq_worker())
+            
             # Start consuming in background
             self.running = True
-            asyncio.create_task(self._consume_loop())
+            self._task = asyncio.create_task(self._consume_loop())
             
         except Exception as e:
             logger.error(f"Failed to start notification consumer: {e}")
@@ -61,26 +81,77 @@ class NotificationConsumer:
         """Stop the Kafka consumer."""
         try:
             self.running = False
+            if self._task:
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+                self._task = None
             if self.consumer:
                 await self.consumer.stop()
                 logger.info("Notification consumer stopped")
+            if self._dlq_task:
+                # Let the worker flush what is already queued, then exit
+                await self._dlq_queue.put(None)
+                await self._dlq_task
+                self._dlq_task = None
+            if self.dlq_producer:
+                await self.dlq_producer.stop()
+                self.dlq_producer = None
         except Exception as e:
             logger.error(f"Error stopping notification consumer: {e}")
     
     async def _consume_loop(self):
-        """Main consumption loop."""
-        try:
-            await self.consumer.consume(
-                handler=self._handle_notification_event,
-                dlq_handler=self._handle_failed_event,
-            )
-        except Exception as e:
-            logger.error(f"Error in consume loop: {e}")
-            # Restart consumer after error
-            if self.running:
-                logger.info("Restarting consumer in 5 seconds...")
-                await asyncio.sleep(5)
-                await self._consume_loop()
+        """
+        Main consumption loop.
+        
+        Restarts consumption after an error with capped, fully jittered
+        exponential backoff, so a broker outage neither spins nor grows the
+        stack, and several replicas don't reconnect in lockstep. Once a
+        batch has been handled the backoff starts over, so a failure after a
+        long healthy run is retried quickly again.
+        """
+        self._restart_attempt = 0
+        while self.running:
+            try:
+                await self.consumer.consume_batch(
+                    handler=self._handle_notification_batch,
+                    batch_size=settings.KAFKA_MAX_POLL_RECORDS,
+                )
+                return
+            except Exception as e:
+                logger.error(f"Error in consume loop: {e}")
+                if not self.running:
+                    return
+                delay = random.uniform(
+                    0, min(_RESTART_MAX_DELAY_SECONDS, 2**self._restart_attempt)
+                )
+                self._restart_attempt += 1
+                logger.info(f"Restarting consumer in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+    
+    async def _handle_notification_batch(self, events: list[dict]):
+        """
+        Handle a polled batch of notification events concurrently.
+        
+        Emails are sent in parallel, at most KAFKA_EMAIL_CONCURRENCY at a
+        time, instead of one SMTP round-trip after another. Each failed
+        event is sent to the DLQ on its own, so the batch as a whole always
+        completes and its offsets are committed afterwards.
+        
+        Args:
+            events: Notification event dictionaries
+        """
+        async def handle_one(event: dict):
+            async with self._send_slots:
+                try:
+                    await self._handle_notification_event(event)
+                except Exception as e:
+                    self._handle_failed_event(event, e)
+        
+        await asyncio.gather(*(handle_one(event) for event in events))
+        
+        # Consumption is healthy again, so the next failure backs off from
+        # the shortest delay
+        self._restart_attempt = 0
     
     async def _handle_notification_event(self, event: dict):
         """
@@ -143,48 +214,81 @@ class NotificationConsumer:
             )
             raise
     
-    async def _handle_failed_event(self, event: dict, error: Exception):
+    def _handle_failed_event(self, event: dict, error: Exception):
         """
-        Handle failed notification events by sending to DLQ.
+        Queue a failed notification event for the DLQ.
+        
+        The DLQ send happens in _dlq_worker, so a failure never holds up the
+        rest of its batch on a broker round-trip.
         
         Args:
             event: Failed notification event
             error: Exception that caused the failure
         """
+        from datetime import datetime
+        
+        logger.warning(
+            f"Sending failed notification to DLQ: "
+            f"event_id={event.get('event_id')}, "
+            f"error={str(error)}"
+        )
+        
         try:
-            from shared.kafka import KafkaProducer
-            from datetime import datetime
-            
-            logger.warning(
-                f"Sending failed notification to DLQ: "
-                f"event_id={event.get('event_id')}, "
-                f"error={str(error)}"
-            )
-            
-            # Send to DLQ
-            dlq_producer = KafkaProducer(
-                bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
-                client_id=f"{settings.APP_NAME}-dlq-producer",
-            )
-            await dlq_producer.start()
-            
-            await dlq_producer.send_raw(
-                topic="notification-dlq",
-                value={
+            self._dlq_queue.put_nowait(
+                {
                     "original_event": event,
                     "error": str(error),
                     "error_type": type(error).__name__,
                     "timestamp": datetime.utcnow().isoformat(),
                     "service": settings.APP_NAME,
-                },
+                }
             )
+        except asyncio.QueueFull:
+            logger.error(
+                f"DLQ queue full, dropping failed event: "
+                f"event_id={event.get('event_id')}"
+            )
+    
+    async def _dlq_worker(self):
+        """
+        Send queued failures to the DLQ topic until stop() queues None.
+        
+        Everything already waiting is sent together, so the producer packs
+        the records into shared batches instead of one request per failure.
+        """
+        stopping = False
+        while not stopping:
+            batch = [await self._dlq_queue.get()]
+            while (
+                not self._dlq_queue.empty()
+                and len(batch) < settings.KAFKA_MAX_POLL_RECORDS
+            ):
+                batch.append(self._dlq_queue.get_nowait())
+            if None in batch:
+                stopping = True
+                batch = [entry for entry in batch if entry is not None]
+            if not batch:
+                continue
             
-            await dlq_producer.stop()
+            if not self.dlq_producer or not self.dlq_producer.is_started:
+                logger.error(
+                    f"DLQ producer not started, dropping {len(batch)} failed event(s)"
+                )
+                continue
             
-            logger.info(f"Event sent to DLQ: event_id={event.get('event_id')}")
-        
-        except Exception as dlq_error:
-            logger.error(f"Failed to send event to DLQ: {dlq_error}")
+            results = await asyncio.gather(
+                *(
+                    self.dlq_producer.send_raw(topic="notification-dlq", value=entry)
+                    for entry in batch
+                ),
+                return_exceptions=True,
+            )
+            for entry, result in zip(batch, results):
+                event_id = entry["original_event"].get("event_id")
+                if result is True:
+                    logger.info(f"Event sent to DLQ: event_id={event_id}")
+                else:
+                    logger.error(f"Failed to send event to DLQ: event_id={event_id}")
 
 
 # Global consumer instance
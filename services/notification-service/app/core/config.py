@@ -3,6 +3,7 @@ Application configuration module.
 Centralized settings for database, email, CORS, and application metadata.
 """
 
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -25,6 +26,10 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 3306
     DB_CHARSET: str = "utf8"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # Seconds; keep below MySQL wait_timeout
+    THREADPOOL_SIZE: int = 20  # Worker threads for sync routes; match DB_POOL_SIZE
 
     # CORS Settings
     CORS_ORIGINS: str = "https://localhost,http://localhost:3000"
@@ -40,12 +45,17 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str = "noreply@hrms.com"
     SMTP_FROM_NAME: str = "HRMS Notification Service"
     SMTP_TLS: bool = True
+    SMTP_POOL_SIZE: int = 5  # Max SMTP connections open at once
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100  # Recycle connections after this
 
     # Notification Settings
     MAX_RETRIES: int = 3
-    RETRY_DELAY_SECONDS: int = 300
+    RETRY_BASE_DELAY_SECONDS: int = 2  # Backoff for the first retry
+    RETRY_DELAY_SECONDS: int = 300  # Upper bound on the retry backoff
+    RETRY_POLL_INTERVAL_SECONDS: int = 30  # How often due retries are picked up
+    RETRY_BATCH_SIZE: int = 50  # Max retries picked up per poll
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS_ORIGINS from comma-separated string."""
         if isinstance(self.CORS_ORIGINS, str):
@@ -67,14 +77,31 @@ class Settings(BaseSettings):
     KAFKA_NOTIFICATION_TOPIC: str = "notification-queue"
     KAFKA_CONSUMER_GROUP_ID: str = "notification-service-group"
     KAFKA_ENABLE_CONSUMER: bool = True  # Feature flag to enable/disable Kafka consumer
-
-
-    @property
+    KAFKA_MAX_POLL_RECORDS: int = 100  # Events handled per consumer batch
+    KAFKA_EMAIL_CONCURRENCY: int = 20  # Emails sent in parallel per batch
+    KAFKA_DLQ_QUEUE_MAX_SIZE: int = 1000  # Failed events waiting for the DLQ
+    KAFKA_ACKS: str = "1"
+    KAFKA_COMPRESSION_TYPE: str = "lz4"
+    KAFKA_LINGER_MS: int = 50  # Wait to fill batches before sending
+    KAFKA_BATCH_SIZE: int = 131072  # 128KB per-partition batches
+
+    @cached_property
+    def kafka_producer_options(self) -> dict:
+        """Producer tuning passed to shared.kafka producers."""
+        return {
+            "acks": self.KAFKA_ACKS,
+            "compression_type": self.KAFKA_COMPRESSION_TYPE,
+            "linger_ms": self.KAFKA_LINGER_MS,
+            "max_batch_size": self.KAFKA_BATCH_SIZE,
+        }
+
+
+    @cached_property
     def database_url(self) -> str:
         """Generate MySQL database URL."""
         return f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset={self.DB_CHARSET}"
 
-    @property
+    @cached_property
     def database_url_without_db(self) -> str:
         """Generate MySQL URL without database name (for initial connection)."""
         return f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}?charset={self.DB_CHARSET}"
@@ -84,5 +111,11 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once."""
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
@@ -3,12 +3,14 @@ Database configuration and session management.
 Handles database engine creation, session management, and table initialization.
 """
 
+from datetime import datetime, timezone
 from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy import text
+from sqlalchemy import inspect, text, update
 from typing import Generator
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.models.notification import Notification, NotificationStatus
 
 logger = get_logger(__name__)
 
@@ -39,15 +41,44 @@ def create_db_and_tables() -> None:
     """
     create_database()
     SQLModel.metadata.create_all(engine)
+    upgrade_tables()
     logger.info("Database tables created successfully")
 
 
+def upgrade_tables() -> None:
+    """
+    Add columns introduced after the tables were first created.
+
+    create_all only creates missing tables, so a column added to an existing
+    model is added here. Notifications that were already waiting for a retry
+    when next_retry_at was added are made due right away.
+    """
+    columns = {
+        column["name"] for column in inspect(engine).get_columns("notifications")
+    }
+    if "next_retry_at" in columns:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("ALTER TABLE notifications ADD COLUMN next_retry_at DATETIME NULL")
+        )
+        conn.execute(
+            update(Notification)
+            .where(Notification.status == NotificationStatus.RETRYING)
+            .values(next_retry_at=datetime.now(timezone.utc))
+        )
+    logger.info("Added notifications.next_retry_at")
+
+
 # Create the database engine
 engine = create_engine(
     settings.database_url,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    pool_size=settings.DB_POOL_SIZE,  # Connections kept open in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections under burst load
     pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before MySQL drops them
 )
 
 
@@ -56,8 +87,12 @@ def get_session() -> Generator[Session, None, None]:
     Dependency that provides a database session.
     Automatically handles session lifecycle and cleanup.
 
+    Objects are not expired on commit, so a handler can return a row it just
+    wrote without another SELECT; the generated id comes back with the
+    INSERT itself.
+
     Yields:
         Session: SQLModel database session
     """
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
@@ -3,14 +3,22 @@ FastAPI Application Entry Point.
 Notification Service main application file with minimal configuration - delegates to modular components.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.database import create_db_and_tables
 from app.core.logging import get_logger
-from app.api.routes.notifications import router as notifications_router
+from app.api.routes.notifications import (
+    router as notifications_router,
+    run_retry_scheduler,
+)
+from app.services.email import close_smtp_connections
 
 logger = get_logger(__name__)
 
@@ -23,6 +31,14 @@ async def lifespan(_: FastAPI):
     """
     # Startup
     logger.info("Starting Notification Service...")
+
+    # Size the worker threads to the DB pool so sync routes don't queue on
+    # connections while holding a thread
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREADPOOL_SIZE)
+    )
+
     logger.info("Creating database and tables...")
     create_db_and_tables()
     logger.info("Database and tables created successfully")
@@ -39,6 +55,9 @@ async def lifespan(_: FastAPI):
     else:
         logger.info("Kafka consumer disabled (KAFKA_ENABLE_CONSUMER=False)")
     
+    # Send failed notifications again once their backoff has passed
+    retry_task = asyncio.create_task(run_retry_scheduler())
+    
     logger.info("Notification Service startup complete")
 
     yield
@@ -46,6 +65,9 @@ async def lifespan(_: FastAPI):
     # Shutdown
     logger.info("Notification Service shutting down...")
     
+    retry_task.cancel()
+    await asyncio.gather(retry_task, return_exceptions=True)
+    
     # Stop Kafka consumer
     if settings.KAFKA_ENABLE_CONSUMER:
         try:
@@ -55,6 +77,8 @@ async def lifespan(_: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping Kafka consumer: {e}")
 
+    await close_smtp_connections()
+
 
 
 # Initialize FastAPI application
@@ -63,6 +87,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="HRMS Notification Service for sending email and other notifications",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -5,6 +5,7 @@ Defines both the SQLModel table structure and request/response models.
 
 from datetime import datetime
 from enum import Enum
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from typing import Optional
 
@@ -30,12 +31,21 @@ class Notification(SQLModel, table=True):
     """
     Notification database table model.
     Stores all notification records and their delivery status.
+
+    The list endpoints filter by employee or status and page in id order;
+    the composite indexes serve both the filter and the ordering. Ids grow
+    with creation time, so (status, id) also yields the oldest rows in a
+    status first, and created_at needs no index of its own.
     """
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notif_emp_id", "employee_id", "id"),
+        Index("ix_notif_status_id", "status", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    employee_id: int = Field(index=True, nullable=False)
+    employee_id: int = Field(nullable=False)
     recipient_email: str = Field(index=True, max_length=255, nullable=False)
     recipient_name: str = Field(max_length=255, nullable=False)
     subject: str = Field(max_length=500, nullable=False)
@@ -44,15 +54,15 @@ class Notification(SQLModel, table=True):
         default=NotificationChannel.EMAIL, nullable=False
     )
     status: NotificationStatus = Field(
-        default=NotificationStatus.PENDING, nullable=False, index=True
+        default=NotificationStatus.PENDING, nullable=False
     )
     retry_count: int = Field(default=0, nullable=False)
     error_message: Optional[str] = Field(default=None, nullable=True)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, nullable=False, index=True
-    )
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     sent_at: Optional[datetime] = Field(default=None, nullable=True)
+    # When a RETRYING notification is next due to be sent
+    next_retry_at: Optional[datetime] = Field(default=None, nullable=True)
 
 
 # Pydantic Schemas for API requests/responses
@@ -105,6 +115,7 @@ class NotificationPublic(NotificationBase):
     created_at: datetime
     updated_at: datetime
     sent_at: Optional[datetime] = None
+    next_retry_at: Optional[datetime] = None
 
 
 class NotificationListResponse(SQLModel):
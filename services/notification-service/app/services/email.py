@@ -1,16 +1,152 @@
 """
 Email service module.
 Handles sending emails via SMTP with async support.
+
+Logged-in SMTP connections are pooled and reused across sends, so the
+TLS handshake and login are paid once per connection, not once per email.
 """
 
+import asyncio
 import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from email.utils import formataddr
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Same sender on every email, so format it once
+_FROM_HEADER = formataddr((settings.SMTP_FROM_NAME, settings.SMTP_FROM_EMAIL))
+
+async def _connect() -> aiosmtplib.SMTP:
+    """Open and log in a new SMTP connection."""
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        use_tls=settings.SMTP_TLS,
+    )
+    await smtp.connect()
+    await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+    return smtp
+
+
+async def _quit(smtp: aiosmtplib.SMTP) -> None:
+    """Close an SMTP connection politely, falling back to dropping it."""
+    try:
+        await smtp.quit()
+    except Exception as e:
+        logger.warning(f"Error closing SMTP connection: {e}")
+        smtp.close()
+
+
+class SMTPConnectionPool:
+    """
+    Pool of logged-in SMTP connections reused across sends.
+
+    At most ``size`` connections are in use at once. An idle connection is
+    checked with NOOP before reuse and replaced if the server has dropped
+    it, and each connection is retired after ``max_messages`` sends so
+    long-lived sessions stay under server-side per-connection limits.
+    """
+
+    def __init__(self, size: int, max_messages: int):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of connections in use at once
+            max_messages: Messages sent over a connection before it is closed
+        """
+        self._slots = asyncio.Semaphore(size)
+        self._max_messages = max_messages
+        # Idle connections with the number of messages each has sent
+        self._idle: list[tuple[aiosmtplib.SMTP, int]] = []
+
+    async def acquire(self) -> tuple[aiosmtplib.SMTP, int]:
+        """
+        Take a healthy connection, opening a new one if none is idle.
+
+        Returns:
+            The connection and the number of messages it has sent so far
+        """
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                smtp, sent = self._idle.pop()
+                try:
+                    await smtp.noop()
+                    return smtp, sent
+                except Exception:
+                    smtp.close()
+            return await _connect(), 0
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(
+        self, smtp: aiosmtplib.SMTP, sent: int, reusable: bool = True
+    ) -> None:
+        """
+        Return a connection taken with acquire().
+
+        Args:
+            smtp: The connection
+            sent: Messages sent over it so far
+            reusable: False if the connection failed and must be dropped
+        """
+        try:
+            if not reusable:
+                smtp.close()
+            elif sent >= self._max_messages:
+                await _quit(smtp)
+            else:
+                self._idle.append((smtp, sent))
+        finally:
+            self._slots.release()
+
+    async def send_message(self, message: EmailMessage) -> None:
+        """
+        Send a message over a pooled connection.
+
+        Args:
+            message: The message to send
+        """
+        smtp, sent = await self.acquire()
+        try:
+            await smtp.send_message(message)
+        except Exception:
+            await self.release(smtp, sent, reusable=False)
+            raise
+        await self.release(smtp, sent + 1)
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        while self._idle:
+            smtp, _sent = self._idle.pop()
+            await _quit(smtp)
+
+
+_pool = SMTPConnectionPool(
+    settings.SMTP_POOL_SIZE, settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+)
+
+
+async def close_smtp_connections() -> None:
+    """Close every pooled SMTP connection. Called on application shutdown."""
+    await _pool.close()
+
+
+def _build_message(
+    to_email: str, to_name: str, subject: str, body: str, html: bool
+) -> EmailMessage:
+    """Build the message for one email."""
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = _FROM_HEADER
+    message["To"] = formataddr((to_name, to_email))
+    message.set_content(body, subtype="html" if html else "plain")
+    return message
+
 
 async def send_email(
     to_email: str,
@@ -33,24 +169,10 @@ async def send_email(
         bool: True if successful, False otherwise
     """
     try:
-        # Create message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
-        message["To"] = f"{to_name} <{to_email}>"
-
-        # Add body
-        part = MIMEText(body, "html" if html else "plain")
-        message.attach(part)
+        message = _build_message(to_email, to_name, subject, body, html)
 
         # Send email
-        async with aiosmtplib.SMTP(
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            use_tls=settings.SMTP_TLS,
-        ) as smtp:
-            await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            await smtp.send_message(message)
+        await _pool.send_message(message)
 
         logger.info(f"Email sent successfully to {to_email}")
         return True
@@ -60,22 +182,7 @@ async def send_email(
         return False
 
 
-async def send_notification_email(
-    to_email: str,
-    to_name: str,
-    subject: str,
-    body: str,
-) -> bool:
-    """
-    Send a notification email.
-
-    Args:
-        to_email: Recipient email address
-        to_name: Recipient name
-        subject: Email subject
-        body: Email body content
+# Notification emails are plain text, which is send_email's default; an alias
+# rather than a wrapper saves a coroutine per send
+send_notification_email = send_email
 
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    return await send_email(to_email, to_name, subject, body, html=False)
@@ -3,10 +3,12 @@ Shared Kafka consumer for HRMS microservices.
 Provides a reusable async Kafka consumer with error handling and dead letter queue support.
 """
 
-import json
+import asyncio
 import logging
+import time
 from typing import Optional, Callable, Awaitable, Dict, Any
-from aiokafka import AIOKafkaConsumer
+import orjson
+from aiokafka import AIOKafkaConsumer, TopicPartition
 from aiokafka.errors import KafkaError
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,9 @@ class KafkaConsumer:
     """
     Async Kafka consumer wrapper with error handling and DLQ support.
     
+    Message values are decoded from JSON; message keys are left as raw
+    bytes, since handlers only receive values.
+    
     Usage:
         async def handle_message(message):
             print(f"Received: {message}")
@@ -40,6 +45,12 @@ class KafkaConsumer:
         max_poll_records: int = 100,
         session_timeout_ms: int = 30000,
         heartbeat_interval_ms: int = 10000,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 500,
+        fetch_max_bytes: int = 52428800,  # 50MB
+        max_partition_fetch_bytes: int = 1048576,  # 1MB
+        commit_every: int = 50,
+        commit_interval_ms: int = 5000,
     ):
         """
         Initialize Kafka consumer.
@@ -54,6 +65,13 @@ class KafkaConsumer:
             max_poll_records: Maximum records to fetch in one poll
             session_timeout_ms: Session timeout in milliseconds
             heartbeat_interval_ms: Heartbeat interval in milliseconds
+            fetch_min_bytes: Data the broker waits for before answering a fetch
+            fetch_max_wait_ms: Longest the broker waits to reach fetch_min_bytes
+            fetch_max_bytes: Maximum data returned by one fetch request
+            max_partition_fetch_bytes: Maximum data returned per partition
+            commit_every: Messages consume() processes between offset commits
+            commit_interval_ms: Longest consume() goes without committing
+                processed messages
         """
         self.bootstrap_servers = bootstrap_servers
         self.group_id = group_id
@@ -64,6 +82,12 @@ class KafkaConsumer:
         self.max_poll_records = max_poll_records
         self.session_timeout_ms = session_timeout_ms
         self.heartbeat_interval_ms = heartbeat_interval_ms
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
+        self.fetch_max_bytes = fetch_max_bytes
+        self.max_partition_fetch_bytes = max_partition_fetch_bytes
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
         self._consumer: Optional[AIOKafkaConsumer] = None
         self._started = False
         self._running = False
@@ -85,8 +109,11 @@ class KafkaConsumer:
                 max_poll_records=self.max_poll_records,
                 session_timeout_ms=self.session_timeout_ms,
                 heartbeat_interval_ms=self.heartbeat_interval_ms,
-                value_deserializer=lambda m: json.loads(m.decode("utf-8")),
-                key_deserializer=lambda k: k.decode("utf-8") if k else None,
+                fetch_min_bytes=self.fetch_min_bytes,
+                fetch_max_wait_ms=self.fetch_max_wait_ms,
+                fetch_max_bytes=self.fetch_max_bytes,
+                max_partition_fetch_bytes=self.max_partition_fetch_bytes,
+                value_deserializer=orjson.loads,
             )
             await self._consumer.start()
             self._started = True
@@ -115,14 +142,30 @@ class KafkaConsumer:
     async def consume(
         self,
         handler: Callable[[Dict[str, Any]], Awaitable[None]],
-        dlq_handler: Optional[Callable[[Dict[str, Any], Exception], Awaitable[None]]] = None,
+        dlq_handler: Optional[Callable[..., Awaitable[None]]] = None,
+        dlq_batch_size: int = 1,
     ):
         """
         Start consuming messages and process them with the handler.
         
+        Messages are fetched with getmany() rather than iterated one at a
+        time, so the loop also wakes up while the topic is idle. Offsets are
+        committed every commit_every messages or commit_interval_ms after
+        the last commit, whichever comes first (even if no new messages
+        arrive), and once more when consumption stops. Only messages that
+        were handled (or passed to the DLQ handler) are committed.
+        
+        With dlq_batch_size of 1, dlq_handler is called as
+        ``dlq_handler(message, error)`` for each failure. Above 1, failures
+        are buffered and dlq_handler is called with a list of
+        ``(message, error)`` tuples once the buffer is full, before each
+        offset commit and when consumption stops. The handler can then
+        queue every DLQ record and flush the producer once.
+        
         Args:
             handler: Async function to process each message
             dlq_handler: Optional async function to handle failed messages (DLQ)
+            dlq_batch_size: Failed messages passed to dlq_handler per call
         """
         if not self._started or not self._consumer:
             logger.error("Consumer not started. Call start() first.")
@@ -131,49 +174,94 @@ class KafkaConsumer:
         self._running = True
         logger.info(f"Starting to consume messages from {self.topics}")
         
+        # Next offset to commit per partition, for messages not yet committed
+        processed: Dict[TopicPartition, int] = {}
+        uncommitted = 0
+        last_commit = time.monotonic()
+        dlq_buffer: list[tuple[Dict[str, Any], Exception]] = []
+        
+        async def flush_dlq():
+            if not dlq_buffer:
+                return
+            try:
+                await dlq_handler(list(dlq_buffer))
+            except Exception as dlq_error:
+                logger.error(
+                    f"Error sending {len(dlq_buffer)} messages to DLQ: {dlq_error}"
+                )
+            dlq_buffer.clear()
+        
+        async def commit():
+            nonlocal uncommitted, last_commit
+            await flush_dlq()
+            await self._consumer.commit(processed)
+            processed.clear()
+            uncommitted = 0
+            last_commit = time.monotonic()
+        
         try:
-            async for message in self._consumer:
-                if not self._running:
-                    break
-                
-                try:
-                    logger.debug(
-                        f"Received message: topic={message.topic}, "
-                        f"partition={message.partition}, "
-                        f"offset={message.offset}, "
-                        f"key={message.key}"
-                    )
-                    
-                    # Process the message
-                    await handler(message.value)
-                    
-                    # Manually commit offset if auto-commit is disabled
-                    if not self.enable_auto_commit:
-                        await self._consumer.commit()
-                    
-                    logger.debug(
-                        f"Message processed successfully: "
-                        f"topic={message.topic}, offset={message.offset}"
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Error processing message: {e}, "
-                        f"topic={message.topic}, "
-                        f"partition={message.partition}, "
-                        f"offset={message.offset}"
-                    )
-                    
-                    # Send to DLQ if handler is provided
-                    if dlq_handler:
+            while self._running:
+                # Wake up by the time the next interval commit is due, so
+                # handled messages are committed even when the topic goes quiet
+                timeout_ms = self.commit_interval_ms
+                if processed:
+                    elapsed_ms = (time.monotonic() - last_commit) * 1000
+                    timeout_ms = max(int(self.commit_interval_ms - elapsed_ms), 0)
+                records = await self._consumer.getmany(
+                    timeout_ms=timeout_ms, max_records=self.commit_every
+                )
+                for messages in records.values():
+                    for message in messages:
+                        if not self._running:
+                            break
+                        
                         try:
-                            await dlq_handler(message.value, e)
-                        except Exception as dlq_error:
-                            logger.error(f"Error sending to DLQ: {dlq_error}")
-                    
-                    # Commit offset even on error to avoid reprocessing
-                    if not self.enable_auto_commit:
-                        await self._consumer.commit()
+                            logger.debug(
+                                f"Received message: topic={message.topic}, "
+                                f"partition={message.partition}, "
+                                f"offset={message.offset}, "
+                                f"key={message.key}"
+                            )
+                            
+                            # Process the message
+                            await handler(message.value)
+                            
+                            logger.debug(
+                                f"Message processed successfully: "
+                                f"topic={message.topic}, offset={message.offset}"
+                            )
+                        
+                        except Exception as e:
+                            logger.error(
+                                f"Error processing message: {e}, "
+                                f"topic={message.topic}, "
+                                f"partition={message.partition}, "
+                                f"offset={message.offset}"
+                            )
+                            
+                            # Send to DLQ if handler is provided
+                            if dlq_handler and dlq_batch_size > 1:
+                                dlq_buffer.append((message.value, e))
+                                if len(dlq_buffer) >= dlq_batch_size:
+                                    await flush_dlq()
+                            elif dlq_handler:
+                                try:
+                                    await dlq_handler(message.value, e)
+                                except Exception as dlq_error:
+                                    logger.error(f"Error sending to DLQ: {dlq_error}")
+                        
+                        # Failed messages count as processed too, to avoid
+                        # reprocessing
+                        if not self.enable_auto_commit:
+                            tp = TopicPartition(message.topic, message.partition)
+                            processed[tp] = message.offset + 1
+                            uncommitted += 1
+                            if uncommitted >= self.commit_every:
+                                await commit()
+                
+                elapsed_ms = (time.monotonic() - last_commit) * 1000
+                if processed and elapsed_ms >= self.commit_interval_ms:
+                    await commit()
         
         except KafkaError as e:
             logger.error(f"Kafka error while consuming: {e}")
@@ -182,6 +270,12 @@ class KafkaConsumer:
             logger.error(f"Unexpected error while consuming: {e}")
             raise
         finally:
+            await flush_dlq()
+            if processed:
+                try:
+                    await self._consumer.commit(processed)
+                except Exception as e:
+                    logger.error(f"Error committing offsets on stop: {e}")
             logger.info("Stopped consuming messages")
     
     async def consume_batch(
@@ -189,14 +283,27 @@ class KafkaConsumer:
         handler: Callable[[list[Dict[str, Any]]], Awaitable[None]],
         batch_size: int = 100,
         dlq_handler: Optional[Callable[[list[Dict[str, Any]], Exception], Awaitable[None]]] = None,
+        batch_timeout_ms: int = 500,
+        handler_concurrency: int = 1,
     ):
         """
         Consume messages in batches for better performance.
         
+        Each batch holds whatever the broker has ready, up to batch_size
+        messages, so a quiet topic is never left waiting for a full batch.
+        Offsets are committed once per batch.
+        
+        With handler_concurrency above 1, a batch is split by partition and
+        up to that many partitions are handled at once. Order within a
+        partition is kept, and a failure only sends that partition's
+        messages to the DLQ handler.
+        
         Args:
             handler: Async function to process a batch of messages
-            batch_size: Number of messages to batch together
+            batch_size: Maximum number of messages to batch together
             dlq_handler: Optional async function to handle failed batches
+            batch_timeout_ms: How long to wait for messages when none are ready
+            handler_concurrency: Partitions of a batch handled in parallel
         """
         if not self._started or not self._consumer:
             logger.error("Consumer not started. Call start() first.")
@@ -205,57 +312,45 @@ class KafkaConsumer:
         self._running = True
         logger.info(f"Starting batch consumption from {self.topics} (batch_size={batch_size})")
         
-        batch = []
+        slots = asyncio.Semaphore(max(handler_concurrency, 1))
         
-        try:
-            async for message in self._consumer:
-                if not self._running:
-                    break
-                
-                batch.append(message.value)
-                
-                if len(batch) >= batch_size:
-                    try:
-                        logger.debug(f"Processing batch of {len(batch)} messages")
-                        await handler(batch)
-                        
-                        if not self.enable_auto_commit:
-                            await self._consumer.commit()
-                        
-                        logger.debug(f"Batch processed successfully: {len(batch)} messages")
-                        batch = []
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing batch: {e}")
-                        
-                        if dlq_handler:
-                            try:
-                                await dlq_handler(batch, e)
-                            except Exception as dlq_error:
-                                logger.error(f"Error sending batch to DLQ: {dlq_error}")
-                        
-                        if not self.enable_auto_commit:
-                            await self._consumer.commit()
-                        
-                        batch = []
-            
-            # Process remaining messages in batch
-            if batch:
+        async def handle(batch: list[Dict[str, Any]]):
+            async with slots:
                 try:
-                    logger.debug(f"Processing final batch of {len(batch)} messages")
+                    logger.debug(f"Processing batch of {len(batch)} messages")
                     await handler(batch)
-                    
-                    if not self.enable_auto_commit:
-                        await self._consumer.commit()
+                    logger.debug(f"Batch processed successfully: {len(batch)} messages")
                     
                 except Exception as e:
-                    logger.error(f"Error processing final batch: {e}")
+                    logger.error(f"Error processing batch: {e}")
                     
                     if dlq_handler:
                         try:
                             await dlq_handler(batch, e)
                         except Exception as dlq_error:
-                            logger.error(f"Error sending final batch to DLQ: {dlq_error}")
+                            logger.error(f"Error sending batch to DLQ: {dlq_error}")
+        
+        try:
+            while self._running:
+                records = await self._consumer.getmany(
+                    timeout_ms=batch_timeout_ms, max_records=batch_size
+                )
+                shards = [
+                    [message.value for message in messages]
+                    for messages in records.values()
+                    if messages
+                ]
+                if not shards:
+                    continue
+                
+                if handler_concurrency > 1:
+                    await asyncio.gather(*(handle(shard) for shard in shards))
+                else:
+                    await handle([value for shard in shards for value in shard])
+                
+                # Commit even on error to avoid reprocessing
+                if not self.enable_auto_commit:
+                    await self._consumer.commit()
         
         except KafkaError as e:
             logger.error(f"Kafka error while batch consuming: {e}")
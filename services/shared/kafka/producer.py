@@ -3,9 +3,11 @@ Shared Kafka producer for HRMS microservices.
 Provides a reusable async Kafka producer with error handling and retry logic.
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from functools import partial
+from typing import Optional, Dict, Any, List
+import orjson
 from aiokafka import AIOKafkaProducer
 from aiokafka.errors import KafkaError
 from .schemas import BaseEvent
@@ -13,6 +15,42 @@ from .schemas import BaseEvent
 logger = logging.getLogger(__name__)
 
 
+def _event_bytes(event: BaseEvent) -> bytes:
+    """Serialize an event to JSON bytes with its compiled pydantic serializer."""
+    # model_dump_json() would decode these bytes to str, only to be re-encoded
+    return event.__pydantic_serializer__.to_json(event)
+
+
+def _log_send_result(event_id: str, event_type: str, future: asyncio.Future) -> None:
+    """Log the broker's delivery result for an event sent without waiting."""
+    if future.cancelled():
+        logger.warning(
+            f"Event send cancelled: event_id={event_id}, event_type={event_type}"
+        )
+    elif future.exception() is not None:
+        logger.error(
+            f"Kafka error sending event: {future.exception()}, "
+            f"event_id={event_id}, "
+            f"event_type={event_type}"
+        )
+    else:
+        metadata = future.result()
+        logger.info(
+            f"Event sent successfully: topic={metadata.topic}, "
+            f"partition={metadata.partition}, "
+            f"offset={metadata.offset}, "
+            f"event_id={event_id}, "
+            f"event_type={event_type}"
+        )
+
+
+def _serialize_value(value: Any) -> bytes:
+    """Encode a message value; events arrive already serialized to bytes."""
+    if isinstance(value, bytes):
+        return value
+    return orjson.dumps(value, default=str)
+
+
 class KafkaProducer:
     """
     Async Kafka producer wrapper with error handling and retry logic.
@@ -32,6 +70,9 @@ class KafkaProducer:
         retries: int = 3,
         compression_type: str = "lz4",
         max_request_size: int = 1048576,  # 1MB
+        enable_idempotence: bool = False,
+        linger_ms: int = 10,
+        max_batch_size: int = 262144,  # 256KB
     ):
         """
         Initialize Kafka producer.
@@ -41,8 +82,14 @@ class KafkaProducer:
             client_id: Client identifier for the producer
             acks: Number of acknowledgments the producer requires
             retries: Number of retries on transient errors
-            compression_type: Compression algorithm (none, gzip, snappy, lz4, zstd)
+            compression_type: Compression algorithm (none, gzip, snappy, lz4, zstd);
+                lz4 by default, which is cheap on CPU and compresses whole batches
             max_request_size: Maximum size of a request in bytes
+            enable_idempotence: Whether the broker deduplicates retried sends
+                (forces acks=all, so leave off for fire-and-forget events)
+            linger_ms: How long to wait for more messages before sending a batch;
+                a short linger lets concurrent sends share one compressed request
+            max_batch_size: Maximum size of a per-partition batch in bytes
         """
         self.bootstrap_servers = bootstrap_servers
         self.client_id = client_id or "hrms-producer"
@@ -50,6 +97,9 @@ class KafkaProducer:
         self.retries = retries
         self.compression_type = compression_type
         self.max_request_size = max_request_size
+        self.enable_idempotence = enable_idempotence
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
         self._producer: Optional[AIOKafkaProducer] = None
         self._started = False
     
@@ -67,7 +117,10 @@ class KafkaProducer:
                 retries=self.retries,
                 compression_type=self.compression_type,
                 max_request_size=self.max_request_size,
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+                enable_idempotence=self.enable_idempotence,
+                linger_ms=self.linger_ms,
+                max_batch_size=self.max_batch_size,
+                value_serializer=_serialize_value,
                 key_serializer=lambda k: k.encode("utf-8") if k else None,
             )
             await self._producer.start()
@@ -97,35 +150,45 @@ class KafkaProducer:
         event: BaseEvent,
         key: Optional[str] = None,
         partition: Optional[int] = None,
+        wait_for_ack: bool = True,
     ) -> bool:
         """
         Send an event to a Kafka topic.
         
+        By default waits for the broker acknowledgment. With
+        wait_for_ack=False it only waits until the event is in the
+        producer's buffer, so concurrent sends are batched together, and the
+        delivery result is logged from a callback instead.
+        
         Args:
             topic: Kafka topic name
             event: Event object (must inherit from BaseEvent)
             key: Optional message key for partitioning
             partition: Optional specific partition to send to
+            wait_for_ack: Whether to wait for the broker acknowledgment
         
         Returns:
-            True if successful, False otherwise
+            True if the event was acknowledged (or, without wait_for_ack,
+            queued), False otherwise
         """
         if not self._started or not self._producer:
             logger.error("Producer not started. Call start() first.")
             return False
         
         try:
-            # Convert Pydantic model to dict
-            event_dict = event.model_dump(mode="json")
-            
-            # Send to Kafka
             future = await self._producer.send(
                 topic=topic,
-                value=event_dict,
+                value=_event_bytes(event),
                 key=key,
                 partition=partition,
             )
             
+            if not wait_for_ack:
+                future.add_done_callback(
+                    partial(_log_send_result, event.event_id, event.event_type)
+                )
+                return True
+            
             # Wait for acknowledgment
             record_metadata = await future
             
@@ -153,6 +216,95 @@ class KafkaProducer:
             )
             return False
     
+    async def send_event_nowait(
+        self,
+        topic: str,
+        event: BaseEvent,
+        key: Optional[str] = None,
+        partition: Optional[int] = None,
+    ) -> asyncio.Future:
+        """
+        Queue an event for sending without waiting for the broker acknowledgment.
+        
+        Only waits until the event is accepted into the producer's buffer. The
+        returned future resolves to the record metadata once the broker
+        acknowledges it, or raises the delivery error.
+        
+        Args:
+            topic: Kafka topic name
+            event: Event object (must inherit from BaseEvent)
+            key: Optional message key for partitioning
+            partition: Optional specific partition to send to
+        
+        Returns:
+            Delivery future for the event
+        
+        Raises:
+            RuntimeError: If the producer has not been started
+        """
+        if not self._started or not self._producer:
+            raise RuntimeError("Producer not started. Call start() first.")
+        
+        return await self._producer.send(
+            topic=topic,
+            value=_event_bytes(event),
+            key=key,
+            partition=partition,
+        )
+    
+    async def send_batch(
+        self,
+        topic: str,
+        events: List[BaseEvent],
+        key: Optional[str] = None,
+    ) -> int:
+        """
+        Send several events to a Kafka topic and wait for all acknowledgments.
+        
+        Every event is handed to the producer before any acknowledgment is
+        awaited, so they are packed into shared record batches instead of
+        paying one broker round-trip each.
+        
+        Args:
+            topic: Kafka topic name
+            events: Event objects (must inherit from BaseEvent)
+            key: Optional message key for partitioning
+        
+        Returns:
+            Number of events that were acknowledged
+        """
+        if not self._started or not self._producer:
+            logger.error("Producer not started. Call start() first.")
+            return 0
+        
+        futures = []
+        for event in events:
+            try:
+                futures.append(
+                    await self._producer.send(
+                        topic=topic,
+                        value=_event_bytes(event),
+                        key=key,
+                    )
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error queueing event: {e}, "
+                    f"event_id={event.event_id}, "
+                    f"event_type={event.event_type}"
+                )
+        
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        sent = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Kafka error sending batched event: {result}")
+            else:
+                sent += 1
+        
+        logger.info(f"Batch sent: topic={topic}, sent={sent}/{len(events)}")
+        return sent
+    
     async def send_raw(
         self,
         topic: str,
@@ -212,13 +364,18 @@ class KafkaProducer:
 _producer_instance: Optional[KafkaProducer] = None
 
 
-async def get_producer(bootstrap_servers: str, client_id: str) -> KafkaProducer:
+async def get_producer(
+    bootstrap_servers: str, client_id: str, **options: Any
+) -> KafkaProducer:
     """
     Get or create a singleton Kafka producer instance.
     
     Args:
         bootstrap_servers: Kafka bootstrap servers
         client_id: Client identifier
+        **options: Extra KafkaProducer settings (acks, compression_type,
+            linger_ms, max_batch_size, ...). Only applied when the producer
+            is created, so pass them from the first call (usually startup).
     
     Returns:
         KafkaProducer instance
@@ -229,6 +386,7 @@ async def get_producer(bootstrap_servers: str, client_id: str) -> KafkaProducer:
         _producer_instance = KafkaProducer(
             bootstrap_servers=bootstrap_servers,
             client_id=client_id,
+            **options,
         )
         await _producer_instance.start()
     
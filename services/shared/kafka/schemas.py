@@ -5,7 +5,7 @@ Defines Pydantic models for all event types across the system.
 
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -54,14 +54,15 @@ class EventType(str, Enum):
 class BaseEvent(BaseModel):
     """Base event model for all Kafka events."""
     
+    # Schemas are built on first use, so services only pay for the events
+    # they actually produce
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
+    
     event_id: str = Field(..., description="Unique event identifier (UUID)")
     event_type: EventType = Field(..., description="Type of event")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Event timestamp (UTC)")
     source_service: str = Field(..., description="Service that produced the event")
     correlation_id: Optional[str] = Field(None, description="Correlation ID for tracking related events")
-    
-    class Config:
-        use_enum_values = True
 
 
 # ============================================================================
@@ -166,7 +167,7 @@ class LeaveEventData(BaseModel):
     
     leave_id: int
     employee_id: int
-    employee_email: str
+    employee_email: Optional[str] = None
     employee_name: Optional[str] = None
     leave_type: str
     start_date: str
@@ -348,7 +349,7 @@ def create_leave_event(
     event_type: EventType,
     leave_id: int,
     employee_id: int,
-    employee_email: str,
+    employee_email: Optional[str],
     leave_type: str,
     start_date: str,
     end_date: str,